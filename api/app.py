@@ -32,6 +32,8 @@ Dependencies:
         Backend web framework.
     - Flask-CORS
         Allow frontend apps to access the API.
+    - orjson
+        Fast JSON serialization for responses.
 
 Custom Modules:
     - config
@@ -56,6 +58,7 @@ import logging
 
 # Custom Module Imports
 from backend.config import Config
+from backend.json_provider import OrjsonProvider
 from database import (
     DatabaseContext,
     DatabaseManager,
@@ -175,6 +178,9 @@ configure_logging(debug=False)
 # Initialize Flask application
 app = Flask(__name__)
 
+# Serialize JSON with orjson (used by jsonify and request.get_json)
+app.json = OrjsonProvider(app)
+
 # Load configuration
 config = Config
 app.config.from_object(config)
@@ -10,6 +10,7 @@ from .layer import LayerModel, LayerService
 from .annotation import AnnotationModel, AnnotationService
 from .export import ExportService
 from .tile_config import TileLayerConfig, get_tile_config
+from .json_provider import OrjsonProvider
 
 __all__ = [
     'Config',
@@ -26,4 +27,5 @@ __all__ = [
     'ExportService',
     'TileLayerConfig',
     'get_tile_config',
+    'OrjsonProvider',
 ]
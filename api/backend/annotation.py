@@ -12,8 +12,12 @@ Classes:
 Third-party modules:
     Flask:
         current_app: Access the Flask application context.
+    orjson:
+        Fast JSON library, for the coordinates and style columns.
 
 Local modules:
+    backend.timestamps:
+        TimestampMixin: Cached ISO timestamps.
     database:
         DatabaseContext: Context manager for database connections.
         DatabaseManager: Manager for database operations.
@@ -25,6 +29,7 @@ from typing import (
     Optional,
     Dict,
     Any,
+    Iterator,
     List,
     Union,
     overload
@@ -33,13 +38,14 @@ from datetime import (
     datetime,
     timezone
 )
-import json
 import logging
 
 # Third-party imports
 from flask import current_app
+import orjson
 
 # Local imports
+from backend.timestamps import TimestampMixin
 from database import (
     DatabaseContext,
     DatabaseManager
@@ -49,7 +55,7 @@ from database import (
 logger = logging.getLogger(__name__)
 
 
-class AnnotationModel:
+class AnnotationModel(TimestampMixin):
     """
     A data structure that represents an annotation on a custom layer.
     This reflects the 'annotations' table in the database.
@@ -81,6 +87,22 @@ class AnnotationModel:
         'text'
     ]
 
+    # Fixed field layout. Slots skip the per-instance __dict__, so
+    #   attribute reads are descriptor loads, and every
+    #   annotation in a list response costs less memory
+    __slots__ = (
+        'id',
+        'layer_id',
+        'annotation_type',
+        'coordinates',
+        'style',
+        'content',
+        '_created_at',
+        '_updated_at',
+        '_created_at_iso',
+        '_updated_at_iso',
+    )
+
     def __init__(
         self,
         layer_id: int,
@@ -126,23 +148,34 @@ class AnnotationModel:
         self.style = style or {}
         self.content = content
 
-        # Timestamps are in UTC
-        self.created_at = created_at or datetime.now(timezone.utc)
-        self.updated_at = updated_at or datetime.now(timezone.utc)
+        # Timestamps are in UTC. The clock is only read if one is
+        #   missing, and both share the same reading
+        if created_at is None or updated_at is None:
+            now = datetime.now(timezone.utc)
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
 
     def to_dict(
-        self
+        self,
+        iso_dates: bool = True
     ) -> Dict[str, Any]:
         """
         Convert annotation to dictionary representation.
+            Timestamps are formatted once, then reused on later calls
 
         Args:
-            None
+            iso_dates (bool): If True, timestamps are ISO strings.
+                If False, they are datetimes, for a JSON encoder that
+                handles them natively (orjson).
 
         Returns:
             Dict[str, Any]: Dictionary representation of the annotation
         """
 
+        created_at, updated_at = self._timestamps(iso_dates)
+
         return {
             'id': self.id,
             'layer_id': self.layer_id,
@@ -150,16 +183,8 @@ class AnnotationModel:
             'coordinates': self.coordinates,
             'style': self.style,
             'content': self.content,
-            'created_at': (
-                self.created_at.isoformat()
-                if self.created_at
-                else None
-            ),
-            'updated_at': (
-                self.updated_at.isoformat()
-                if self.updated_at
-                else None
-            )
+            'created_at': created_at,
+            'updated_at': updated_at
         }
 
     @classmethod
@@ -206,6 +231,9 @@ class AnnotationService:
     """
     Service class for annotation operations.
 
+    Attributes:
+        FIELDS (List[str]): Annotation columns, in streamed tuple order
+
     Methods:
         __init__:
             Initialize AnnotationService
@@ -213,18 +241,34 @@ class AnnotationService:
             Serialize config dictionary to JSON string
         _deserialize_config:
             Deserialize config JSON string to dictionary
+        _deserialize_style:
+            Deserialize a stored style, skipping the parser when empty
         _row_to_model:
             Convert database row to AnnotationModel
         create:
             Create a new annotation
         read:
             Get an annotation by ID or list annotations by layer ID
+        iter_annotations:
+            Stream the annotations for a layer, one at a time
         update:
             Update an annotation
         delete:
             Delete an annotation
     """
 
+    # Columns for streamed reads. iter_rows() returns tuples in this order
+    FIELDS = [
+        'id',
+        'layer_id',
+        'annotation_type',
+        'coordinates',
+        'style',
+        'content',
+        'created_at',
+        'updated_at'
+    ]
+
     def __init__(self) -> None:
         """
         Initialize the AnnotationService.
@@ -250,7 +294,7 @@ class AnnotationService:
             str: JSON string representation of the config
         """
 
-        return json.dumps(config)
+        return orjson.dumps(config).decode()
 
     @staticmethod
     def _deserialize_config(
@@ -266,30 +310,50 @@ class AnnotationService:
             Dict[str, Any]: Configuration dictionary
         """
 
-        return json.loads(config_str)
+        return orjson.loads(config_str)
+
+    @staticmethod
+    def _deserialize_style(
+        style_str: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Deserialize a stored style.
+            Most annotations keep the default style, stored as '{}',
+            so that is matched as a string rather than parsed.
+
+        Args:
+            style_str (Optional[str]): JSON string of the style, if any
+
+        Returns:
+            Dict[str, Any]: Style dictionary, empty if there is none
+        """
+
+        if not style_str or style_str == '{}':
+            return {}
+
+        return orjson.loads(style_str)
 
     def _row_to_model(
         self,
-        row: Dict[str, Any]
+        row: Any
     ) -> AnnotationModel:
         """
         Convert a database row to a AnnotationModel.
 
         Args:
-            row (Dict[str, Any]): Database row
+            row (sqlite3.Row): Database row.
+                Used as-is, without copying to a dict
 
         Returns:
             AnnotationModel: Project model instance
         """
 
-        style = self._deserialize_config(row['style']) if row['style'] else {}
-
         return AnnotationModel(
             id=row['id'],
             layer_id=row['layer_id'],
             annotation_type=row['annotation_type'],
             coordinates=self._deserialize_config(row['coordinates']),
-            style=style,
+            style=self._deserialize_style(row['style']),
             content=row['content'],
             created_at=datetime.fromisoformat(row['created_at']),
             updated_at=datetime.fromisoformat(row['updated_at'])
@@ -312,47 +376,51 @@ class AnnotationService:
             ValueError: If layer does not exist or is not editable
         """
 
-        # Validate that the layer exists
+        # Serialize coordinates and style to JSON
+        coords_json = self._serialize_config(annotation.coordinates)
+        style_json = self._serialize_config(annotation.style)
+
+        # Check the layer and insert in one write transaction
+        #   One connection for both, and the layer can't be deleted or
+        #   made read-only between the check and the insert
         try:
             with DatabaseContext(self.db_path) as db_ctx:
+                db_ctx.begin_write()
                 db_manager = DatabaseManager(db_ctx)
-                layer_row = db_manager.read(
-                    table="layers",
-                    fields=['id', 'is_editable'],
-                    params={
-                        'id': annotation.layer_id
-                    }
-                )
 
-            if not layer_row:
-                raise ValueError(
-                    f"Layer with ID {annotation.layer_id} does not exist"
-                )
+                # Validate that the layer exists
+                try:
+                    layer_row = db_manager.read(
+                        table="layers",
+                        fields=['id', 'is_editable'],
+                        params={
+                            'id': annotation.layer_id
+                        }
+                    )
 
-            # Check if the layer is editable
-            is_editable = layer_row[1]
-            if not is_editable:
-                logger.error(
-                    f"Attempt to create annotation on read-only layer ID "
-                    f"{annotation.layer_id}"
-                )
-                raise ValueError(
-                    "Cannot create annotations on read-only layers"
-                )
+                    if not layer_row:
+                        raise ValueError(
+                            f"Layer with ID {annotation.layer_id} "
+                            f"does not exist"
+                        )
 
-        except Exception as e:
-            raise ValueError(
-                f"Error validating layer: {str(e)}"
-            )
+                    # Check if the layer is editable
+                    is_editable = layer_row[1]
+                    if not is_editable:
+                        logger.error(
+                            f"Attempt to create annotation on read-only "
+                            f"layer ID {annotation.layer_id}"
+                        )
+                        raise ValueError(
+                            "Cannot create annotations on read-only layers"
+                        )
 
-        # Serialize coordinates and style to JSON
-        coords_json = self._serialize_config(annotation.coordinates)
-        style_json = self._serialize_config(annotation.style)
+                except Exception as e:
+                    raise ValueError(
+                        f"Error validating layer: {str(e)}"
+                    )
 
-        # Insert the annotation into the database
-        try:
-            with DatabaseContext(self.db_path) as db_ctx:
-                db_manager = DatabaseManager(db_ctx)
+                # Insert the annotation into the database
                 annotation.id = db_manager.create(
                     table="annotations",
                     params={
@@ -364,6 +432,10 @@ class AnnotationService:
                     }
                 )
 
+        # Validation errors already say what went wrong
+        except ValueError:
+            raise
+
         except Exception as e:
             raise ValueError(
                 f"Error creating annotation: {str(e)}"
@@ -405,7 +477,10 @@ class AnnotationService:
         if annotation_id:
             logger.info(f"Reading annotation ID: {annotation_id}")
             try:
-                with DatabaseContext(self.db_path) as db_ctx:
+                with DatabaseContext(
+                    self.db_path,
+                    read_only=True
+                ) as db_ctx:
                     db_manager = DatabaseManager(db_ctx)
                     row = db_manager.read(
                         table="annotations",
@@ -422,54 +497,72 @@ class AnnotationService:
 
             # Single Row
             if annotation_id:
-                row_dict = {}
                 if row:
                     row = row[0] if isinstance(row, list) else row
-                    for key in row.keys():
-                        row_dict[key] = row[key]
-                    return self._row_to_model(row_dict)
+                    return self._row_to_model(row)
                 return None
 
         # Retrieve all annotations for a layer
+        #   Rows come in chunks as plain tuples, see iter_annotations()
         elif layer_id:
-            logger.info(f"Listing annotations for layer ID: {layer_id}")
-            with DatabaseContext(self.db_path) as db_ctx:
-                db_manager = DatabaseManager(db_ctx)
-                rows = db_manager.read(
-                    table="annotations",
-                    fields=['*'],
-                    params={
-                        'layer_id': layer_id
-                    },
-                    order_by=['created_at'],
-                    get_all=True
-                )
+            return list(self.iter_annotations(layer_id))
 
-            annotations = []
-            if rows:
-                for row in rows:
-                    style = self._deserialize_config(
-                        row['style']
-                    ) if row['style'] else {}
-                    coordinates = self._deserialize_config(row['coordinates'])
-                    annotations.append(
-                        AnnotationModel(
-                            id=row['id'],
-                            layer_id=row['layer_id'],
-                            annotation_type=row['annotation_type'],
-                            coordinates=coordinates,
-                            style=style,
-                            content=row['content'],
-                            created_at=datetime.fromisoformat(
-                                row['created_at']
-                            ),
-                            updated_at=datetime.fromisoformat(
-                                row['updated_at']
-                            )
-                        )
-                    )
+    def iter_annotations(
+        self,
+        layer_id: int
+    ) -> Iterator[AnnotationModel]:
+        """
+        Stream the annotations for a layer, one at a time.
+            Rows are pulled from sqlite in chunks as the caller iterates,
+            so a large layer is never held in memory all at once.
+            The connection stays borrowed until iteration finishes.
 
-            return annotations
+        Args:
+            layer_id (int): Layer ID
+
+        Returns:
+            Iterator[AnnotationModel]: Annotations, oldest first
+        """
+
+        logger.info("Listing annotations for layer ID: %s", layer_id)
+
+        # Look the converters up once, not for every row
+        deserialize = self._deserialize_config
+        deserialize_style = self._deserialize_style
+        parse_time = datetime.fromisoformat
+
+        with DatabaseContext(
+            self.db_path,
+            read_only=True
+        ) as db_ctx:
+            db_manager = DatabaseManager(db_ctx)
+            for (
+                annotation_id,
+                row_layer_id,
+                annotation_type,
+                coordinates,
+                style,
+                content,
+                created_at,
+                updated_at
+            ) in db_manager.iter_rows(
+                table="annotations",
+                fields=self.FIELDS,
+                params={
+                    'layer_id': layer_id
+                },
+                order_by=['created_at']
+            ):
+                yield AnnotationModel(
+                    id=annotation_id,
+                    layer_id=row_layer_id,
+                    annotation_type=annotation_type,
+                    coordinates=deserialize(coordinates),
+                    style=deserialize_style(style),
+                    content=content,
+                    created_at=parse_time(created_at),
+                    updated_at=parse_time(updated_at)
+                )
 
     def update(
         self,
@@ -509,15 +602,17 @@ class AnnotationService:
         # Always update the updated_at timestamp
         all_fields["updated_at"] = "CURRENT_TIMESTAMP"
 
+        # The UPDATE returns the new row, so there's no second query
         try:
             with DatabaseContext(self.db_path) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
-                db_manager.update(
+                row = db_manager.update(
                     table="annotations",
                     fields=all_fields,
                     parameters={
                         'id': annotation_id
-                    }
+                    },
+                    returning=True
                 )
 
         except Exception as e:
@@ -525,7 +620,10 @@ class AnnotationService:
                 f"Error updating annotation: {str(e)}"
             )
 
-        return self.read(annotation_id=annotation_id)
+        if not row:
+            return None
+
+        return self._row_to_model(row)
 
     def delete(
         self,
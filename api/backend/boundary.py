@@ -7,6 +7,10 @@ Uses GeoJSON format for geographic data.
     GeoJSON is a format for encoding a variety of geographic data structures.
     https://geojson.org/
 
+Functions:
+    prepare_ring:
+        Prepare a polygon for point-in-polygon tests.
+
 Classes:
     BoundaryModel:
         A data structure that represents a geographic boundary for a map area.
@@ -16,8 +20,12 @@ Classes:
 Third-party libraries:
     Flask:
         current_app - to access application configuration
+    orjson:
+        fast JSON library, for the coordinates column
 
 Local modules:
+    backend.timestamps:
+        TimestampMixin - Cached ISO timestamps
     database:
         DatabaseContext - context manager for database connections
         DatabaseManager - class for database operations
@@ -30,20 +38,26 @@ from typing import (
     Dict,
     Any,
     List,
-    Tuple
+    Tuple,
+    Union
 )
 from datetime import (
     datetime,
     timezone
 )
-import json
 import logging
 
 # Third-party imports
 from flask import current_app
+import orjson
 
 # Local imports
-from backend.constants import BOUNDARY_MIN_COORDINATES
+from backend.timestamps import TimestampMixin
+from backend.constants import (
+    BOUNDARY_MIN_COORDINATES,
+    BOUNDARY_EDGES_PER_BAND,
+    BOUNDARY_MAX_BANDS,
+)
 from database import (
     DatabaseContext,
     DatabaseManager
@@ -53,7 +67,82 @@ from database import (
 logger = logging.getLogger(__name__)
 
 
-class BoundaryModel:
+# A polygon edge prepared for ray casting: (xi, yi, yj, slope), where
+#   slope is (xj - xi) / (yj - yi), the change in x per unit of y
+Edge = Tuple[float, float, float, float]
+
+# A polygon prepared for testing points: its edges sorted into bands
+#   along y, the scale from y offset to band number, and the bounding
+#   box (min_x, max_x, min_y, max_y)
+Ring = Tuple[
+    List[List[Edge]],
+    float,
+    Tuple[float, float, float, float]
+]
+
+
+def prepare_ring(
+    polygon: List[List[float]]
+) -> Ring:
+    """
+    Prepare a polygon for point-in-polygon tests.
+        The per-edge values only depend on the polygon, so they're
+        worked out once, rather than again for every point tested.
+        Horizontal edges can never cross a horizontal ray,
+        so they're left out. That also means every slope has a
+        non-zero divisor, and tests multiply by it instead of dividing.
+
+    Edges are sorted into equal bands along y. A ray at y only crosses
+    edges that span y, and all of those are in y's band, so a point
+    tests one band rather than every edge of a large polygon.
+
+    Args:
+        polygon (List[List[float]]): Polygon coordinates
+
+    Returns:
+        Ring: The edges by band, where i is a vertex and j is the
+            vertex before it, the band scale, and the bounding box
+    """
+
+    edges = []
+
+    # The first edge joins the last vertex back to the first
+    xj, yj = polygon[-1][0], polygon[-1][1]
+    for vertex in polygon:
+        xi, yi = vertex[0], vertex[1]
+        if yi != yj:
+            edges.append((xi, yi, yj, (xj - xi) / (yj - yi)))
+        xj, yj = xi, yi
+
+    xs = [vertex[0] for vertex in polygon]
+    ys = [vertex[1] for vertex in polygon]
+    min_y, max_y = min(ys), max(ys)
+
+    # Small polygons get one band, so there's no sorting to do
+    band_count = min(
+        max(len(edges) // BOUNDARY_EDGES_PER_BAND, 1),
+        BOUNDARY_MAX_BANDS
+    )
+    if band_count == 1:
+        return [edges], 0.0, (min(xs), max(xs), min_y, max_y)
+
+    # Each edge goes in every band between its two ends
+    #   The same formula picks a point's band, so rounding can't put a
+    #   point in a band that's missing an edge it crosses
+    scale = band_count / (max_y - min_y)
+    last = band_count - 1
+    bands: List[List[Edge]] = [[] for _ in range(band_count)]
+    for edge in edges:
+        low, high = sorted((edge[1], edge[2]))
+        first_band = min(int((low - min_y) * scale), last)
+        last_band = min(int((high - min_y) * scale), last)
+        for band in range(first_band, last_band + 1):
+            bands[band].append(edge)
+
+    return bands, scale, (min(xs), max(xs), min_y, max_y)
+
+
+class BoundaryModel(TimestampMixin):
     """
     Represents a geographic boundary for a map.
 
@@ -74,8 +163,25 @@ class BoundaryModel:
             Create boundary from dictionary
         to_geojson:
             Convert boundary to GeoJSON format
+        ring:
+            Boundary prepared for point-in-polygon tests
     """
 
+    # Fixed field layout. Slots skip the per-instance __dict__, so
+    #   attribute reads are descriptor loads, and every
+    #   boundary in a list response costs less memory
+    __slots__ = (
+        'id',
+        'map_id',
+        'layer_id',
+        '_coordinates',
+        '_ring',
+        '_created_at',
+        '_updated_at',
+        '_created_at_iso',
+        '_updated_at_iso',
+    )
+
     def __init__(
         self,
         map_id: int,
@@ -117,37 +223,89 @@ class BoundaryModel:
         self.map_id = map_id
         self.layer_id = layer_id
         self.coordinates = coordinates
-        self.created_at = created_at or datetime.now(timezone.utc)
-        self.updated_at = updated_at or datetime.now(timezone.utc)
+        # Timestamps are in UTC. The clock is only read if one is
+        #   missing, and both share the same reading
+        if created_at is None or updated_at is None:
+            now = datetime.now(timezone.utc)
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @property
+    def coordinates(
+        self
+    ) -> List[List[float]]:
+        """
+        Boundary coordinates.
 
-    def to_dict(
+        Returns:
+            List[List[float]]: List of [lat, lon] coordinate pairs
+        """
+
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(
+        self,
+        value: List[List[float]]
+    ) -> None:
+        """
+        Set the coordinates, dropping the prepared ring.
+
+        Args:
+            value (List[List[float]]): New [lat, lon] coordinate pairs
+
+        Returns:
+            None
+        """
+
+        self._coordinates = value
+        self._ring = None
+
+    @property
+    def ring(
         self
+    ) -> Ring:
+        """
+        The boundary prepared for point-in-polygon tests.
+            Built on first use, then kept until the coordinates change.
+
+        Returns:
+            Ring: Edges by band, and bounding box, from prepare_ring()
+        """
+
+        if self._ring is None:
+            self._ring = prepare_ring(self._coordinates)
+
+        return self._ring
+
+    def to_dict(
+        self,
+        iso_dates: bool = True
     ) -> Dict[str, Any]:
         """
         Convert boundary to dictionary representation.
+            Timestamps are formatted once, then reused on later calls
 
-        args:
-            None
+        Args:
+            iso_dates (bool): If True, timestamps are ISO strings.
+                If False, they are datetimes, for a JSON encoder that
+                handles them natively (orjson).
 
         Returns:
             Dict[str, Any]: Dictionary representation of the boundary
         """
 
+        created_at, updated_at = self._timestamps(iso_dates)
+
         return {
             'id': self.id,
             'map_area_id': self.map_id,
             'layer_id': self.layer_id,
             'coordinates': self.coordinates,
-            'created_at': (
-                self.created_at.isoformat()
-                if self.created_at
-                else None
-            ),
-            'updated_at': (
-                self.updated_at.isoformat()
-                if self.updated_at
-                else None
-            )
+            'created_at': created_at,
+            'updated_at': updated_at
         }
 
     @classmethod
@@ -204,10 +362,13 @@ class BoundaryModel:
             Dict[str, Any]: GeoJSON representation of the boundary
         """
 
-        # Convert [lat, lon] to [lon, lat]
+        # Convert [lat, lon] to (lon, lat)
+        #   Unpacking in the loop avoids two index lookups per vertex,
+        #   which adds up on large polygons
+        #   Tuples are lighter than lists, and serialize as JSON arrays
         geojson_coords = [
-            [coord[1], coord[0]]
-            for coord
+            (lon, lat)
+            for lat, lon
             in self.coordinates
         ]
 
@@ -283,7 +444,7 @@ class BoundaryService:
             str: JSON string representation of the config
         """
 
-        return json.dumps(config)
+        return orjson.dumps(config).decode()
 
     @staticmethod
     def _deserialize_config(
@@ -299,35 +460,39 @@ class BoundaryService:
             Dict[str, Any]: Configuration dictionary
         """
 
-        return json.loads(config_str)
+        return orjson.loads(config_str)
 
     def _row_to_model(
         self,
-        row: Dict[str, Any]
+        row: Any
     ) -> BoundaryModel:
         """
         Convert a database row to a BoundaryModel.
 
         Args:
-            row (Dict[str, Any]): Database row
+            row (sqlite3.Row): Database row.
+                Used as-is, without copying to a dict
 
         Returns:
             BoundaryModel: Boundary model instance
         """
 
+        # layer_id was added to the table later, older databases lack it
+        layer_id = row['layer_id'] if 'layer_id' in row.keys() else None
+
         return BoundaryModel(
             id=row['id'],
             map_id=row['map_area_id'],
-            layer_id=row.get('layer_id'),
-            coordinates=json.loads(row['coordinates']),
+            layer_id=layer_id,
+            coordinates=orjson.loads(row['coordinates']),
             created_at=datetime.fromisoformat(row['created_at']),
             updated_at=datetime.fromisoformat(row['updated_at'])
         )
 
+    @staticmethod
     def _point_in_polygon(
-        self,
         point: Tuple[float, float],
-        polygon: List[List[float]]
+        edges: List[Edge]
     ) -> bool:
         """
         Check if a point is inside a polygon using ray casting algorithm.
@@ -347,7 +512,7 @@ class BoundaryService:
 
         Args:
             point (Tuple[float, float]): Point coordinates [lat, lon]
-            polygon (List[List[float]]): Polygon coordinates
+            edges (List[Edge]): Polygon edges, from prepare_ring()
 
         Returns:
             bool: True if point is inside polygon
@@ -356,24 +521,15 @@ class BoundaryService:
         # X and Y coordinates of the point to test
         x, y = point
 
-        # The number of vertices in the polygon
-        n = len(polygon)
-
         # Initialize 'inside' flag as False
         inside = False
 
-        # The 'j' variable is the index of the previous vertex
-        j = n - 1
-
-        # Loop through each vertex of the polygon
-        for i in range(n):
-            # Get the coordinates of the current and previous vertex
-            # This defines an edge (the line segment between two vertices)
-            xi, yi = polygon[i]
-            xj, yj = polygon[j]
-
+        # Loop through each edge of the polygon
+        #   Each edge is the line segment between vertex 'i' and
+        #   the vertex before it, 'j'
+        for xi, yi, yj, slope in edges:
             # Test if the ray, a horizontal line at 'y', crosses the edge
-            intersect = (
+            if (
                 # Test if the y-coordinate is between
                 # the current and previous vertex y-coordinates.
                 # The 'and' means we proceed to the next test only if true.
@@ -382,17 +538,11 @@ class BoundaryService:
                 # Calulate the x-coordinate of the intersection point
                 # of the edge with the horizontal line at y.
                 # This is compared to the x-coordinate of the point.
-                (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
-            )
-
-            # If the ray crossed the edge, 'intersect' will be non-zero
-            if intersect:
+                (x < (y - yi) * slope + xi)
+            ):
                 # Flip the 'inside' flag
                 inside = not inside
 
-            # Move to the next edge
-            j = i
-
         # After checking all edges, 'inside' will be True if
         # the point is inside the polygon, False otherwise.
         return inside
@@ -412,7 +562,10 @@ class BoundaryService:
         """
 
         try:
-            with DatabaseContext(self.db_path) as db_ctx:
+            with DatabaseContext(
+                self.db_path,
+                read_only=True
+            ) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
                 row = db_manager.read(
                     table="boundaries",
@@ -429,34 +582,49 @@ class BoundaryService:
             raise
 
         if row:
-            row_dict = {}
             this_row = row[0] if isinstance(row, list) else row
-            for key in this_row.keys():
-                row_dict[key] = this_row[key]
-            return self._row_to_model(row_dict)
+            return self._row_to_model(this_row)
 
         return None
 
     def is_within_boundary(
         self,
         coordinates: List[List[float]],
-        parent_boundary: List[List[float]]
+        parent_boundary: Union[BoundaryModel, List[List[float]]]
     ) -> bool:
         """
         Check if all coordinates are within a parent boundary.
 
         Args:
             coordinates (List[List[float]]): Coordinates to check
-            parent_boundary (List[List[float]]): Parent boundary coordinates
+            parent_boundary (Union[BoundaryModel, List[List[float]]]):
+                Parent boundary, or its coordinates.
+                A model reuses its prepared ring between calls.
 
         Returns:
             bool: True if all coordinates are within parent boundary
         """
 
+        # The parent's edges and bounding box, the same for every point
+        if isinstance(parent_boundary, BoundaryModel):
+            ring = parent_boundary.ring
+        else:
+            ring = prepare_ring(parent_boundary)
+        bands, scale, (min_x, max_x, min_y, max_y) = ring
+        last = len(bands) - 1
+
         # Loop through coordinates, using the ray casting algorithm
         for coord in coordinates:
-            point = (coord[0], coord[1])
-            if not self._point_in_polygon(point, parent_boundary):
+            x, y = coord[0], coord[1]
+
+            # A point outside the bounding box can't be inside the
+            #   polygon, so it fails without walking the edges
+            if x < min_x or x > max_x or y < min_y or y > max_y:
+                return False
+
+            # Only the edges in this point's band can cross its ray
+            band = min(int((y - min_y) * scale), last)
+            if not self._point_in_polygon((x, y), bands[band]):
                 return False
 
         return True
@@ -476,7 +644,7 @@ class BoundaryService:
         """
 
         # Convert coordinates to JSON
-        coords_json = json.dumps(boundary.coordinates)
+        coords_json = orjson.dumps(boundary.coordinates).decode()
 
         # Create the boundary in the database
         try:
@@ -518,7 +686,10 @@ class BoundaryService:
 
         # Query the database for the boundary
         try:
-            with DatabaseContext(self.db_path) as db_ctx:
+            with DatabaseContext(
+                self.db_path,
+                read_only=True
+            ) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
                 row = db_manager.read(
                     table="boundaries",
@@ -536,11 +707,8 @@ class BoundaryService:
 
         # Convert to a BoundaryModel
         if row:
-            row_dict = {}
             this_row = row[0] if isinstance(row, list) else row
-            for key in this_row.keys():
-                row_dict[key] = this_row[key]
-            return self._row_to_model(row_dict)
+            return self._row_to_model(this_row)
 
         return None
 
@@ -561,18 +729,20 @@ class BoundaryService:
         """
 
         # Update the boundary in the database
+        #   The UPDATE returns the new row, so there's no second query
         try:
             with DatabaseContext(self.db_path) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
-                db_manager.update(
+                row = db_manager.update(
                     table="boundaries",
                     fields={
-                        "coordinates": json.dumps(coordinates),
+                        "coordinates": orjson.dumps(coordinates).decode(),
                         "updated_at": "CURRENT_TIMESTAMP"
                     },
                     parameters={
                         'id': boundary_id
                     },
+                    returning=True
                 )
 
         except Exception as e:
@@ -581,10 +751,10 @@ class BoundaryService:
             )
             raise
 
-        # Get the updated boundary and return it
-        return self._get_boundary(
-            boundary_id=boundary_id
-        )
+        if not row:
+            return None
+
+        return self._row_to_model(row)
 
     def delete(
         self,
@@ -11,8 +11,12 @@ Classes:
 
 # Standard Library Imports
 import os
+from typing import Optional
 import yaml
 
+# Local Imports
+from backend.constants import MAX_REQUEST_BYTES
+
 
 class Config:
     """
@@ -23,6 +27,10 @@ class Config:
         SECRET_KEY (str): Secret key for session management
         DATABASE_PATH (str): Path to SQLite database file
         EXPORT_FOLDER (str): Path for exported map files
+        EXPORT_ACCEL_PREFIX (Optional[str]): Internal nginx location
+            for export downloads (X-Accel-Redirect), or None to send
+            files from Flask
+        MAX_CONTENT_LENGTH (int): Largest request body, in bytes
         CORS_ORIGINS (list): List of allowed CORS origins
         DEFAULT_MAP_LATITUDE (float): Default latitude for new projects
         DEFAULT_MAP_LONGITUDE (float): Default longitude for new projects
@@ -69,6 +77,16 @@ class Config:
         export_dir.lstrip('../')
     )
 
+    # Let nginx send export files itself (X-Accel-Redirect)
+    #   Only set this when the API is reached through a proxy that
+    #   serves the export folder at this internal location
+    EXPORT_ACCEL_PREFIX: Optional[str] = os.environ.get(
+        'EXPORT_ACCEL_PREFIX'
+    ) or _config_data.get('export_accel_prefix')
+
+    # Largest request body Flask will accept
+    MAX_CONTENT_LENGTH: int = MAX_REQUEST_BYTES
+
     # CORS settings
     CORS_ORIGINS: list = _config_data.get('cors_origins', [])
 
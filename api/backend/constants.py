@@ -49,6 +49,30 @@ LAYER_MAX_LINE_THICKNESS: float = 20
 # Three points define the simplest polygon (a triangle).
 BOUNDARY_MIN_COORDINATES: int = 3
 
+# Maximum number of coordinate pairs accepted for a boundary polygon.
+# Containment checks scale with vertices x parent edges, so this caps the
+# work a single request can cause. Traced suburb outlines are far smaller.
+BOUNDARY_MAX_COORDINATES: int = 100_000
+
+# Containment checks sort a parent boundary's edges into horizontal bands,
+# so each point only tests the edges in its own band. Aim for about this
+# many edges per band...
+BOUNDARY_EDGES_PER_BAND: int = 32
+
+# ...up to this many bands. An edge is stored in every band it spans, so
+# this bounds memory for polygons with long edges.
+BOUNDARY_MAX_BANDS: int = 64
+
+
+# ---------------------------------------------------------------------------
+# Request limits
+# ---------------------------------------------------------------------------
+
+# Largest request body (bytes) Flask will read. Larger bodies get a 413
+# before anything is buffered or parsed. 16 MiB fits a boundary at the
+# coordinate limit, and a typical project import file.
+MAX_REQUEST_BYTES: int = 16 * 1024 * 1024
+
 
 # ---------------------------------------------------------------------------
 # Default colours (server-side)
@@ -90,6 +114,10 @@ EXPORT_TILE_RETRY_MAX: int = 4
 # Actual delay doubles with each successive retry.
 EXPORT_TILE_RETRY_BASE_DELAY: float = 1.0
 
+# Browser cache duration (seconds) for downloaded export files.
+# Export filenames include a timestamp, so a file never changes once written.
+EXPORT_DOWNLOAD_MAX_AGE: int = 86400
+
 
 # ---------------------------------------------------------------------------
 # Tile proxy (routes/tiles.py)
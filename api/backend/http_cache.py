@@ -0,0 +1,46 @@
+"""
+Module: backend.http_cache
+
+HTTP revalidation for single-object GET responses.
+
+Functions:
+    conditional:
+        Tag a response with an ETag, and answer If-None-Match with 304
+
+Third party dependencies:
+    Flask: Web framework, provides the request and response objects.
+"""
+
+
+# Third-party imports
+from flask import (
+    Response,
+    request
+)
+
+
+# Clients may keep the response, but must check it is current first
+REVALIDATE_CACHE_CONTROL = 'private, no-cache'
+
+
+def conditional(
+    response: Response
+) -> Response:
+    """
+    Tag a response with an ETag, and answer If-None-Match with 304.
+        The ETag is a digest of the body. updated_at is stored to
+        the second, so two edits in the same second would share a tag
+        based on it, and a client could keep the older copy.
+        A match still encodes the body, but sends none of it.
+
+    Args:
+        response (Response): A successful JSON response
+
+    Returns:
+        Response: The tagged response, or a 304 if the client is current
+    """
+
+    response.add_etag()
+    response.headers['Cache-Control'] = REVALIDATE_CACHE_CONTROL
+
+    return response.make_conditional(request)
@@ -0,0 +1,144 @@
+"""
+Module: backend.json_provider
+
+JSON handling for the Flask application, backed by orjson.
+
+Classes:
+    OrjsonProvider:
+        Flask JSON provider that serializes with orjson
+
+Third party dependencies:
+    Flask: Web framework, provides the JSON provider interface.
+    orjson: Fast JSON library, written in Rust.
+"""
+
+
+# Standard library imports
+from decimal import Decimal
+from typing import Any
+
+# Third-party imports
+from flask import Response
+from flask.json.provider import JSONProvider
+import orjson
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider that uses orjson.
+        Replaces the stdlib based provider, so jsonify() and
+        request.get_json() both go through orjson.
+        Datetimes are written as ISO 8601 strings by orjson directly,
+        so models can hand over native datetimes.
+
+    Attributes:
+        OPTIONS (int): orjson options used for every dump
+        mimetype (str): Mimetype of JSON responses
+
+    Methods:
+        dumps:
+            Serialize data as a JSON string
+        loads:
+            Deserialize JSON data
+        response:
+            Build a JSON response, without decoding to str first
+    """
+
+    # Allow int keys (stdlib json converts these to strings too)
+    OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    mimetype = "application/json"
+
+    @staticmethod
+    def _default(
+        obj: Any
+    ) -> Any:
+        """
+        Serialize types that orjson does not support natively.
+
+        Args:
+            obj (Any): The object to serialize
+
+        Returns:
+            Any: A serializable representation of the object
+
+        Raises:
+            TypeError: If the object can't be serialized
+        """
+
+        if isinstance(obj, Decimal):
+            return str(obj)
+
+        if hasattr(obj, "__html__"):
+            return str(obj.__html__())
+
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable"
+        )
+
+    def dumps(
+        self,
+        obj: Any,
+        **kwargs: Any
+    ) -> str:
+        """
+        Serialize data as a JSON string.
+
+        Args:
+            obj (Any): The data to serialize
+            kwargs (Any): Ignored, kept for interface compatibility
+
+        Returns:
+            str: The JSON string
+        """
+
+        return orjson.dumps(
+            obj,
+            default=self._default,
+            option=self.OPTIONS
+        ).decode()
+
+    def loads(
+        self,
+        s: str | bytes,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Deserialize JSON data.
+
+        Args:
+            s (str | bytes): Text or UTF-8 bytes
+            kwargs (Any): Ignored, kept for interface compatibility
+
+        Returns:
+            Any: The deserialized data
+        """
+
+        return orjson.loads(s)
+
+    def response(
+        self,
+        *args: Any,
+        **kwargs: Any
+    ) -> Response:
+        """
+        Serialize data as JSON, and wrap it in a response.
+            orjson produces bytes, which are used as the body as-is
+
+        Args:
+            args (Any): A single value, or several to treat as a list
+            kwargs (Any): Treat as a dict to serialize
+
+        Returns:
+            Response: A response object with the JSON body
+        """
+
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(
+                obj,
+                default=self._default,
+                option=self.OPTIONS
+            ),
+            mimetype=self.mimetype
+        )
@@ -12,8 +12,12 @@ Classes:
 Third-party modules:
     flask:
         current_app - Access the Flask application context
+    orjson:
+        Fast JSON library, for the config column
 
 Local modules:
+    backend.timestamps:
+        TimestampMixin - Cached ISO timestamps
     database:
         DatabaseContext - Context manager for database connections
         DatabaseManager - Manager for database operations
@@ -25,7 +29,9 @@ from typing import (
     Optional,
     Dict,
     Any,
+    FrozenSet,
     List,
+    Tuple,
     Union,
     overload
 )
@@ -33,13 +39,14 @@ from datetime import (
     datetime,
     timezone
 )
-import json
 import logging
 
 # Third-party imports
 from flask import current_app
+import orjson
 
 # Local imports
+from backend.timestamps import TimestampMixin
 from database import (
     DatabaseContext,
     DatabaseManager
@@ -49,7 +56,7 @@ from database import (
 logger = logging.getLogger(__name__)
 
 
-class LayerModel:
+class LayerModel(TimestampMixin):
     """
     A data structure that represents a map layer.
     This reflects the layer table in the database
@@ -78,11 +85,33 @@ class LayerModel:
     """
 
     # Define valid layer types
-    LAYER_TYPES = [
+    #   The tuple keeps a stable order for messages, the frozenset
+    #   gives a hashed membership test when validating
+    LAYER_TYPES_ORDERED: Tuple[str, ...] = (
         'annotation',
         'boundary',
         'custom'
-    ]
+    )
+    LAYER_TYPES: FrozenSet[str] = frozenset(LAYER_TYPES_ORDERED)
+
+    # Fixed field layout. Slots skip the per-instance __dict__, so
+    #   attribute reads are descriptor loads, and every
+    #   layer in a list response costs less memory
+    __slots__ = (
+        'id',
+        'map_area_id',
+        'parent_layer_id',
+        'name',
+        'layer_type',
+        'visible',
+        'z_index',
+        'is_editable',
+        'config',
+        '_created_at',
+        '_updated_at',
+        '_created_at_iso',
+        '_updated_at_iso',
+    )
 
     def __init__(
         self,
@@ -125,7 +154,7 @@ class LayerModel:
         if layer_type not in self.LAYER_TYPES:
             raise ValueError(
                 f"Invalid layer_type: {layer_type}. "
-                f"Must be one of {self.LAYER_TYPES}"
+                f"Must be one of {list(self.LAYER_TYPES_ORDERED)}"
             )
 
         self.id = id
@@ -138,23 +167,34 @@ class LayerModel:
         self.is_editable = is_editable
         self.config = config or {}
 
-        # Timestamps are in UTC
-        self.created_at = created_at or datetime.now(timezone.utc)
-        self.updated_at = updated_at or datetime.now(timezone.utc)
+        # Timestamps are in UTC. The clock is only read if one is
+        #   missing, and both share the same reading
+        if created_at is None or updated_at is None:
+            now = datetime.now(timezone.utc)
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
 
     def to_dict(
-        self
+        self,
+        iso_dates: bool = True
     ) -> Dict[str, Any]:
         """
         Convert layer to dictionary representation.
+            Timestamps are formatted once, then reused on later calls
 
         Args:
-            None
+            iso_dates (bool): If True, timestamps are ISO strings.
+                If False, they are datetimes, for a JSON encoder that
+                handles them natively (orjson).
 
         Returns:
             Dict[str, Any]: Dictionary representation of the layer
         """
 
+        created_at, updated_at = self._timestamps(iso_dates)
+
         return {
             'id': self.id,
             'map_area_id': self.map_area_id,
@@ -165,16 +205,8 @@ class LayerModel:
             'z_index': self.z_index,
             'is_editable': self.is_editable,
             'config': self.config,
-            'created_at': (
-                self.created_at.isoformat()
-                if self.created_at
-                else None
-            ),
-            'updated_at': (
-                self.updated_at.isoformat()
-                if self.updated_at
-                else None
-            )
+            'created_at': created_at,
+            'updated_at': updated_at
         }
 
     @classmethod
@@ -231,12 +263,16 @@ class LayerService:
             Serialize config dictionary to JSON string
         _deserialize_config:
             Deserialize config JSON string to dictionary
+        _insert_params:
+            Get the column values to insert a layer with
         _row_to_model:
             Convert database row to Layer model
         _reorder_layers:
             Reorder layers by updating z_index
         _get_inherited_layers:
             Get layers inherited from parent map areas
+        _read_inherited_copies:
+            Read the inherited layers on a map, by parent layer ID
         _list_own_layers:
             List only layers created on this map area
         create:
@@ -276,7 +312,7 @@ class LayerService:
             str: JSON string representation of the config
         """
 
-        return json.dumps(config)
+        return orjson.dumps(config).decode()
 
     @staticmethod
     def _deserialize_config(
@@ -292,7 +328,33 @@ class LayerService:
             Dict[str, Any]: Configuration dictionary
         """
 
-        return json.loads(config_str)
+        return orjson.loads(config_str)
+
+    @classmethod
+    def _insert_params(
+        cls,
+        layer: LayerModel
+    ) -> Dict[str, Any]:
+        """
+        Get the column values to insert a layer with.
+
+        Args:
+            layer (LayerModel): Layer to insert
+
+        Returns:
+            Dict[str, Any]: Column names and values, config as JSON
+        """
+
+        return {
+            "map_area_id": layer.map_area_id,
+            "parent_layer_id": layer.parent_layer_id,
+            "name": layer.name,
+            "layer_type": layer.layer_type,
+            "visible": layer.visible,
+            "z_index": layer.z_index,
+            "is_editable": layer.is_editable,
+            "config": cls._serialize_config(layer.config)
+        }
 
     def _row_to_model(
         self,
@@ -346,16 +408,19 @@ class LayerService:
         # List to hold updated layers
         updated_layers = []
 
-        # Loop through the layers to update (id and z_index)
-        for update in layer_updates:
-            layer_id = update['id']
-            z_index = update['z_index']
+        # All the updates share one transaction, and each UPDATE returns
+        #   its row, so there's no read back per layer
+        with DatabaseContext(self.db_path) as db_ctx:
+            db_manager = DatabaseManager(db_ctx)
 
-            # Update the layer in the database
-            try:
-                with DatabaseContext(self.db_path) as db_ctx:
-                    db_manager = DatabaseManager(db_ctx)
-                    db_manager.update(
+            # Loop through the layers to update (id and z_index)
+            for update in layer_updates:
+                layer_id = update['id']
+                z_index = update['z_index']
+
+                # Update the layer in the database
+                try:
+                    row = db_manager.update(
                         table="layers",
                         fields={
                             "z_index": z_index,
@@ -364,18 +429,18 @@ class LayerService:
                         parameters={
                             'id': layer_id
                         },
+                        returning=True
                     )
 
-            except Exception as e:
-                logger.error(
-                    f"Error reordering layer {layer_id}: {str(e)}"
-                )
-                continue
+                except Exception as e:
+                    logger.error(
+                        f"Error reordering layer {layer_id}: {str(e)}"
+                    )
+                    continue
 
-            # Fetch the updated layer, add to the list
-            updated_layer = self.read(layer_id=layer_id)
-            if updated_layer:
-                updated_layers.append(updated_layer)
+                # Add the updated layer to the list
+                if row:
+                    updated_layers.append(self._row_to_model(row))
 
         return updated_layers
 
@@ -434,9 +499,10 @@ class LayerService:
 
         1. Get the parent map ID and area_type (if there is one)
         2. Get a list of layers from the parent map
-        3. For each parent layer, check if an inherited copy exists
-           on the current map
-        4. If exists, make sure its name is up-to-date; otherwise create it
+        3. Read the inherited copies that already exist on this map,
+           in one query, and match them to the parent layers
+        4. Bring stale names up-to-date, and create missing copies,
+           each as one batch in a single transaction
 
         Args:
             map_id (int): Map ID
@@ -445,9 +511,14 @@ class LayerService:
             List[Layer]: List of inherited layers
         """
 
-        # Get the parent map ID and its area_type in one query
+        # Get the parent map ID, then the parent's area_type
+        #   Both are read on one connection
+        parent_area_type: Optional[str] = None
         try:
-            with DatabaseContext(self.db_path) as db_ctx:
+            with DatabaseContext(
+                self.db_path,
+                read_only=True
+            ) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
                 parent_row = db_manager.read(
                     table="map_areas",
@@ -457,26 +528,35 @@ class LayerService:
                     }
                 )
 
-            # Normalize to a single row
-            if isinstance(parent_row, list):
-                parent_row = parent_row[0] if parent_row else None
+                # Normalize to a single row
+                if isinstance(parent_row, list):
+                    parent_row = parent_row[0] if parent_row else None
 
-            # Check if there is a parent
-            if not parent_row:
-                return []
-
-            # Get the parent ID from the row
-            try:
-                parent_id_value = parent_row['parent_id']
-            except (KeyError, TypeError, IndexError):
-                parent_id_value = parent_row[0] if parent_row else None
+                # Check if there is a parent
+                if not parent_row or not parent_row['parent_id']:
+                    return []
 
-            # Confirm parent_id_value is valid
-            if not parent_id_value:
-                return []
+                # Store the parent ID as an integer
+                parent_id: int = int(parent_row['parent_id'])
 
-            # Store the parent ID as an integer
-            parent_id: int = int(parent_id_value)
+                # Fetch the parent map area's area_type so we can build a
+                # descriptive name (e.g. "Region Boundary").
+                try:
+                    area_row = db_manager.read(
+                        table="map_areas",
+                        fields=['area_type'],
+                        params={'id': parent_id}
+                    )
+                    if isinstance(area_row, list):
+                        area_row = area_row[0] if area_row else None
+                    if area_row:
+                        parent_area_type = area_row['area_type']
+
+                except Exception as e:
+                    logger.warning(
+                        f"Could not fetch area_type for parent map "
+                        f"{parent_id}: {str(e)}"
+                    )
 
         except Exception as e:
             logger.error(
@@ -484,104 +564,153 @@ class LayerService:
             )
             raise
 
-        # Fetch the parent map area's area_type so we can build a
-        # descriptive name (e.g. "Region Boundary", "Suburb Boundary").
-        parent_area_type: Optional[str] = None
+        # Get layers from parent recursively
+        parent_layers = self.read(map_id=parent_id)
+        if not parent_layers:
+            return []
+
+        # Inherited copies already on this map, by the layer they copy
         try:
-            with DatabaseContext(self.db_path) as db_ctx:
-                db_manager = DatabaseManager(db_ctx)
-                area_row = db_manager.read(
-                    table="map_areas",
-                    fields=['area_type'],
-                    params={'id': parent_id}
-                )
-            if area_row:
-                if isinstance(area_row, list):
-                    area_row = area_row[0]
+            existing = self._read_inherited_copies(map_id)
 
-                # sqlite3.Row does not guarantee dict-like .get()
-                # so we resolve the value defensively.
-                try:
-                    parent_area_type = area_row['area_type']
-                except (KeyError, TypeError, IndexError):
-                    parent_area_type = area_row[0] if area_row else None
         except Exception as e:
-            logger.warning(
-                f"Could not fetch area_type for parent map "
-                f"{parent_id}: {str(e)}"
+            logger.error(
+                f"Error checking existing inherited layers for "
+                f"map_area_id {map_id}: {str(e)}"
             )
+            return []
 
-        # Get layers from parent recursively
-        parent_layers = self.read(map_id=parent_id)
-
-        # Create inherited copies of layers for the parent map
-        inherited_layers = []
+        # Sort parent layers into copies to rename, and copies to create
+        renames: List[Tuple[LayerModel, str]] = []
+        missing: List[LayerModel] = []
         for parent_layer in parent_layers:
             # Compute the descriptive name this inherited copy should have
             descriptive_name = self._get_descriptive_layer_name(
                 parent_layer, parent_area_type
             )
 
-            # Check if inherited version already exists
+            existing_layer = existing.get(parent_layer.id)
+            if existing_layer is None:
+                missing.append(
+                    LayerModel(
+                        map_area_id=map_id,
+                        parent_layer_id=parent_layer.id,
+                        name=descriptive_name,
+                        layer_type=parent_layer.layer_type,
+                        visible=parent_layer.visible,
+                        z_index=parent_layer.z_index,
+                        is_editable=False,
+                        config=parent_layer.config
+                    )
+                )
+
+            elif existing_layer.name != descriptive_name:
+                renames.append((existing_layer, descriptive_name))
+
+        # Make sure the stored names are up-to-date, in one transaction
+        #   The models only take the new names once that has committed
+        if renames:
             try:
                 with DatabaseContext(self.db_path) as db_ctx:
                     db_manager = DatabaseManager(db_ctx)
-                    existing_row = db_manager.read(
-                        table="layers",
-                        fields=['*'],
-                        params={
-                            'map_area_id': map_id,
-                            'parent_layer_id': parent_layer.id
-                        }
+                    for layer, new_name in renames:
+                        db_manager.update(
+                            table="layers",
+                            fields={
+                                "name": new_name,
+                                "updated_at": "CURRENT_TIMESTAMP"
+                            },
+                            parameters={'id': layer.id}
+                        )
+
+                for layer, new_name in renames:
+                    layer.name = new_name
+
+            except Exception as e:
+                logger.warning(
+                    f"Could not rename inherited layers on map "
+                    f"{map_id}: {str(e)}"
+                )
+
+        # Create the missing copies, in one transaction
+        #   Existing copies are read again under the write lock, so
+        #   two requests for the same map can't both create a copy
+        if missing:
+            try:
+                with DatabaseContext(self.db_path) as db_ctx:
+                    db_ctx.begin_write()
+                    db_manager = DatabaseManager(db_ctx)
+                    existing.update(
+                        self._read_inherited_copies(map_id, db_manager)
                     )
+                    for layer in missing:
+                        if layer.parent_layer_id in existing:
+                            continue
+                        layer.id = db_manager.create(
+                            table="layers",
+                            params=self._insert_params(layer)
+                        )
+                        existing[layer.parent_layer_id] = layer
 
             except Exception as e:
                 logger.error(
-                    f"Error checking existing inherited layer for "
-                    f"map_area_id {map_id} and parent_layer_id "
-                    f"{parent_layer.id}: {str(e)}"
+                    f"Error creating inherited layers for map_area_id "
+                    f"{map_id}: {str(e)}"
                 )
-                continue
-
-            # If exists, ensure the stored name is up-to-date
-            if existing_row:
-                existing_layer = self._row_to_model(existing_row)
-                if existing_layer.name != descriptive_name:
-                    try:
-                        with DatabaseContext(self.db_path) as db_ctx:
-                            db_manager = DatabaseManager(db_ctx)
-                            db_manager.update(
-                                table="layers",
-                                fields={
-                                    "name": descriptive_name,
-                                    "updated_at": "CURRENT_TIMESTAMP"
-                                },
-                                parameters={'id': existing_layer.id}
-                            )
-                        existing_layer.name = descriptive_name
-                    except Exception as e:
-                        logger.warning(
-                            f"Could not rename inherited layer "
-                            f"{existing_layer.id}: {str(e)}"
-                        )
-                inherited_layers.append(existing_layer)
-
-            # Create new inherited layer with a descriptive name
-            else:
-                inherited_layer = LayerModel(
-                    map_area_id=map_id,
-                    parent_layer_id=parent_layer.id,
-                    name=descriptive_name,
-                    layer_type=parent_layer.layer_type,
-                    visible=parent_layer.visible,
-                    z_index=parent_layer.z_index,
-                    is_editable=False,
-                    config=parent_layer.config
+                raise
+
+        # Inherited layers, in the parent's order
+        return [
+            existing[parent_layer.id]
+            for parent_layer in parent_layers
+            if parent_layer.id in existing
+        ]
+
+    def _read_inherited_copies(
+        self,
+        map_id: int,
+        db_manager: Optional[DatabaseManager] = None
+    ) -> Dict[int, LayerModel]:
+        """
+        Read the inherited layers on a map, in one query.
+
+        Args:
+            map_id (int): Map ID
+            db_manager (Optional[DatabaseManager]): Manager to read with.
+                If None, a read-only connection is used.
+
+        Returns:
+            Dict[int, LayerModel]: Inherited layers, by parent layer ID.
+                If a parent has more than one copy, the oldest is used.
+        """
+
+        if db_manager is None:
+            with DatabaseContext(
+                self.db_path,
+                read_only=True
+            ) as db_ctx:
+                return self._read_inherited_copies(
+                    map_id,
+                    DatabaseManager(db_ctx)
                 )
-                created = self.create(inherited_layer)
-                inherited_layers.append(created)
 
-        return inherited_layers
+        rows = db_manager.read(
+            table="layers",
+            fields=['*'],
+            params={
+                'map_area_id': map_id
+            },
+            order_by=['id'],
+            get_all=True
+        )
+
+        copies: Dict[int, LayerModel] = {}
+        for row in rows or []:
+            parent_layer_id = row['parent_layer_id']
+            if parent_layer_id is not None and parent_layer_id not in copies:
+                copies[parent_layer_id] = self._row_to_model(row)
+
+        return copies
 
     def _list_own_layers(
         self,
@@ -599,7 +728,10 @@ class LayerService:
 
         # Read layers from the database
         try:
-            with DatabaseContext(self.db_path) as db_ctx:
+            with DatabaseContext(
+                self.db_path,
+                read_only=True
+            ) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
                 rows = db_manager.read(
                     table="layers",
@@ -638,25 +770,13 @@ class LayerService:
             Layer: Created layer with assigned ID
         """
 
-        # Serialize config to JSON
-        config_json: str = self._serialize_config(layer.config)
-
         # Insert into the database
         try:
             with DatabaseContext(self.db_path) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
                 layer.id = db_manager.create(
                     table="layers",
-                    params={
-                        "map_area_id": layer.map_area_id,
-                        "parent_layer_id": layer.parent_layer_id,
-                        "name": layer.name,
-                        "layer_type": layer.layer_type,
-                        "visible": layer.visible,
-                        "z_index": layer.z_index,
-                        "is_editable": layer.is_editable,
-                        "config": config_json
-                    }
+                    params=self._insert_params(layer)
                 )
 
         except Exception as e:
@@ -708,7 +828,10 @@ class LayerService:
         # Read a single layer from the database
         if layer_id:
             try:
-                with DatabaseContext(self.db_path) as db_ctx:
+                with DatabaseContext(
+                    self.db_path,
+                    read_only=True
+                ) as db_ctx:
                     db_manager = DatabaseManager(db_ctx)
                     row = db_manager.read(
                         table="layers",
@@ -760,24 +883,6 @@ class LayerService:
             ValueError: If trying to update a non-editable layer
         """
 
-        # Check if layer is editable
-        layer = self.read(layer_id=layer_id)
-        if not layer:
-            return None
-
-        if not layer.is_editable:
-            allowed_inherited_fields = {
-                'visible'
-            }
-            invalid_fields = [
-                field for field in updates
-                if field not in allowed_inherited_fields
-            ]
-            if invalid_fields:
-                raise ValueError(
-                    "Inherited layers can only update visibility."
-                )
-
         # Fields that may appear in updates
         allowed_fields = [
             'name',
@@ -803,25 +908,57 @@ class LayerService:
         # Always update the updated_at timestamp
         all_fields["updated_at"] = "CURRENT_TIMESTAMP"
 
-        try:
-            with DatabaseContext(self.db_path) as db_ctx:
-                db_manager = DatabaseManager(db_ctx)
-                db_manager.update(
+        # Check the layer and update it in one write transaction
+        #   The UPDATE returns the new row, so there's no read back, and
+        #   the layer can't change between the check and the update
+        with DatabaseContext(self.db_path) as db_ctx:
+            db_ctx.begin_write()
+            db_manager = DatabaseManager(db_ctx)
+
+            # Check if layer is editable
+            layer_row = db_manager.read(
+                table="layers",
+                fields=['is_editable'],
+                params={
+                    'id': layer_id
+                }
+            )
+            if not layer_row:
+                return None
+
+            if not layer_row['is_editable']:
+                allowed_inherited_fields = {
+                    'visible'
+                }
+                invalid_fields = [
+                    field for field in updates
+                    if field not in allowed_inherited_fields
+                ]
+                if invalid_fields:
+                    raise ValueError(
+                        "Inherited layers can only update visibility."
+                    )
+
+            try:
+                row = db_manager.update(
                     table="layers",
                     fields=all_fields,
                     parameters={
                         'id': layer_id
                     },
+                    returning=True
                 )
 
-        except Exception as e:
-            logger.error(
-                f"Error updating layer {layer_id}: {str(e)}"
-            )
-            raise
+            except Exception as e:
+                logger.error(
+                    f"Error updating layer {layer_id}: {str(e)}"
+                )
+                raise
+
+        if not row:
+            return None
 
-        # Get the updated layer to return
-        return self.read(layer_id=layer_id)
+        return self._row_to_model(row)
 
     def delete(
         self,
@@ -840,27 +977,30 @@ class LayerService:
             ValueError: If trying to delete a non-editable layer
         """
 
-        # Check if layer exists and is editable
-        layer = self.read(layer_id=layer_id)
-        if not layer:
-            return False
-
-        if not layer.is_editable:
-            raise ValueError(
-                "Cannot delete inherited layer. "
-                "Inherited layers are read-only."
-            )
-
-        # Delete the layer from the database
+        # Delete the layer, only if it's editable
+        #   The check is part of the DELETE, so the common case is a
+        #   single statement
         try:
             with DatabaseContext(self.db_path) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
-                db_manager.delete(
+                cursor = db_manager.delete(
                     table="layers",
                     parameters={
-                        'id': layer_id
+                        'id': layer_id,
+                        'is_editable': True
                     },
                 )
+                deleted = cursor.rowcount > 0
+
+                # Nothing deleted, find out whether the layer exists
+                if not deleted:
+                    layer_row = db_manager.read(
+                        table="layers",
+                        fields=['id'],
+                        params={
+                            'id': layer_id
+                        }
+                    )
 
         except Exception as e:
             logger.error(
@@ -868,4 +1008,13 @@ class LayerService:
             )
             raise
 
-        return True
+        if deleted:
+            return True
+
+        if not layer_row:
+            return False
+
+        raise ValueError(
+            "Cannot delete inherited layer. "
+            "Inherited layers are read-only."
+        )
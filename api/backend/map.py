@@ -39,6 +39,7 @@ import logging
 from flask import current_app
 
 # Local imports
+from backend.timestamps import TimestampMixin
 from database import (
     DatabaseContext,
     DatabaseManager
@@ -48,7 +49,7 @@ from database import (
 logger = logging.getLogger(__name__)
 
 
-class MapModel:
+class MapModel(TimestampMixin):
     """
     Represents a map area within a project hierarchy.
     This reflects the 'map_areas' table in the database.
@@ -81,6 +82,24 @@ class MapModel:
         'individual'
     ]
 
+    # Fixed field layout. Slots skip the per-instance __dict__, so
+    #   attribute reads in to_dict() are descriptor loads, and every
+    #   map in a list response costs less memory
+    __slots__ = (
+        'id',
+        'project_id',
+        'parent_id',
+        'name',
+        'area_type',
+        'default_center_lat',
+        'default_center_lon',
+        'default_zoom',
+        '_created_at',
+        '_updated_at',
+        '_created_at_iso',
+        '_updated_at_iso',
+    )
+
     def __init__(
         self,
         project_id: int,
@@ -131,23 +150,34 @@ class MapModel:
         self.default_center_lat = default_center_lat
         self.default_center_lon = default_center_lon
         self.default_zoom = default_zoom
-        # Timestamps are in UTC
-        self.created_at = created_at or datetime.now(timezone.utc)
-        self.updated_at = updated_at or datetime.now(timezone.utc)
+        # Timestamps are in UTC. The clock is only read if one is
+        #   missing, and both share the same reading
+        if created_at is None or updated_at is None:
+            now = datetime.now(timezone.utc)
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
 
     def to_dict(
-        self
+        self,
+        iso_dates: bool = True
     ) -> Dict[str, Any]:
         """
         Convert map to dictionary representation.
+            Timestamps are formatted once, then reused on later calls
 
         Args:
-            None
+            iso_dates (bool): If True, timestamps are ISO strings.
+                If False, they are datetimes, for a JSON encoder that
+                handles them natively (orjson).
 
         Returns:
             Dict[str, Any]: Dictionary representation of the map area
         """
 
+        created_at, updated_at = self._timestamps(iso_dates)
+
         return {
             'id': self.id,
             'project_id': self.project_id,
@@ -157,16 +187,8 @@ class MapModel:
             'default_center_lat': self.default_center_lat,
             'default_center_lon': self.default_center_lon,
             'default_zoom': self.default_zoom,
-            'created_at': (
-                self.created_at.isoformat()
-                if self.created_at
-                else None
-            ),
-            'updated_at': (
-                self.updated_at.isoformat()
-                if self.updated_at
-                else None
-            )
+            'created_at': created_at,
+            'updated_at': updated_at
         }
 
     @classmethod
@@ -243,30 +265,42 @@ class MapService:
 
     def _row_to_model(
         self,
-        row: Dict[str, Any]
+        row: Any
     ) -> MapModel:
         """
         Convert a database row to a MapModel.
 
         Args:
-            row (Dict[str, Any]): Database row
+            row (sqlite3.Row): Database row.
+                Used as-is, without copying to a dict
 
         Returns:
             MapModel: Map model instance
         """
 
-        row_dict = dict(row)
+        # A row from UPDATE ... RETURNING can hold a whole number in a
+        #   REAL column as an int (see DatabaseManager.update), so ints
+        #   are made floats. Anything else is left as stored
+        center_lat = row['default_center_lat']
+        center_lon = row['default_center_lon']
+
         return MapModel(
-            id=row_dict['id'],
-            project_id=row_dict['project_id'],
-            parent_id=row_dict['parent_id'],
-            name=row_dict['name'],
-            area_type=row_dict['area_type'],
-            default_center_lat=row_dict['default_center_lat'],
-            default_center_lon=row_dict['default_center_lon'],
-            default_zoom=row_dict['default_zoom'],
-            created_at=datetime.fromisoformat(row_dict['created_at']),
-            updated_at=datetime.fromisoformat(row_dict['updated_at'])
+            id=row['id'],
+            project_id=row['project_id'],
+            parent_id=row['parent_id'],
+            name=row['name'],
+            area_type=row['area_type'],
+            default_center_lat=(
+                float(center_lat) if isinstance(center_lat, int)
+                else center_lat
+            ),
+            default_center_lon=(
+                float(center_lon) if isinstance(center_lon, int)
+                else center_lon
+            ),
+            default_zoom=row['default_zoom'],
+            created_at=datetime.fromisoformat(row['created_at']),
+            updated_at=datetime.fromisoformat(row['updated_at'])
         )
 
     def create(
@@ -342,7 +376,10 @@ class MapService:
         # Read a single map area by ID
         if map_id:
             try:
-                with DatabaseContext(self.db_path) as db_ctx:
+                with DatabaseContext(
+                    self.db_path,
+                    read_only=True
+                ) as db_ctx:
                     db_manager = DatabaseManager(db_ctx)
                     row = db_manager.read(
                         table="map_areas",
@@ -354,7 +391,7 @@ class MapService:
 
                 if row:
                     row = row[0] if isinstance(row, list) else row
-                    return self._row_to_model(dict(row))
+                    return self._row_to_model(row)
 
                 return None
 
@@ -362,55 +399,36 @@ class MapService:
                 logger.error(f"Error reading map area: {e}")
                 raise
 
-        # List all map areas for a project
-        elif parent_id is None:
-            try:
-                with DatabaseContext(self.db_path) as db_ctx:
-                    db_manager = DatabaseManager(db_ctx)
-                    rows = db_manager.read(
-                        table="map_areas",
-                        fields=['*'],
-                        params={
-                            'project_id': project_id
-                        },
-                        order_by=['created_at'],
-                        get_all=True
-                    )
-
-            except Exception as e:
-                logger.error(f"Error reading map areas: {e}")
-                raise
+        # List the map areas for a project, by parent if one is given
+        #   One query shape per case, so each uses its own index
+        params: Dict[str, Any] = {
+            'project_id': project_id
+        }
+        if parent_id is not None:
+            params['parent_id'] = parent_id
 
-        # All maps, filtered by parent_id
-        else:
-            try:
-                with DatabaseContext(self.db_path) as db_ctx:
-                    db_manager = DatabaseManager(db_ctx)
-                    rows = db_manager.read(
-                        table="map_areas",
-                        fields=['*'],
-                        params={
-                            'project_id': project_id,
-                            'parent_id': parent_id
-                        },
-                        order_by=['created_at'],
-                        get_all=True
-                    )
+        try:
+            with DatabaseContext(
+                self.db_path,
+                read_only=True
+            ) as db_ctx:
+                db_manager = DatabaseManager(db_ctx)
+                rows = db_manager.read(
+                    table="map_areas",
+                    fields=['*'],
+                    params=params,
+                    order_by=['created_at'],
+                    get_all=True
+                )
 
-            except Exception as e:
-                logger.error(f"Error reading map areas: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Error reading map areas: {e}")
+            raise
 
-        map_areas = []
-        if rows:
-            for row in rows:
-                map_areas.append(
-                    self._row_to_model(dict(row))
-                )
-        else:
+        if not rows:
             return []
 
-        return map_areas
+        return [self._row_to_model(row) for row in rows]
 
     def update(
         self,
@@ -446,24 +464,28 @@ class MapService:
         # Always update the updated_at timestamp
         all_fields["updated_at"] = "CURRENT_TIMESTAMP"
 
+        # Update the map in the database
+        #   The UPDATE returns the new row, so there's no second query
         try:
             with DatabaseContext(self.db_path) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
-                db_manager.update(
+                row = db_manager.update(
                     table="map_areas",
                     fields=all_fields,
                     parameters={
                         'id': map_area_id
                     },
+                    returning=True
                 )
 
         except Exception as e:
             logger.error(f"Error updating map area: {e}")
             raise
 
-        return self.read(
-            map_id=map_area_id
-        )
+        if not row:
+            return None
+
+        return self._row_to_model(row)
 
     def delete(
         self,
@@ -14,6 +14,8 @@ Third-party modules:
         current_app: Access the Flask application context.
 
 Local modules:
+    backend.timestamps:
+        TimestampMixin: Cached ISO timestamps.
     database:
         DatabaseContext: Context manager for database connections.
         DatabaseManager: Manager for database operations.
@@ -21,6 +23,10 @@ Local modules:
 
 
 # Standard library imports
+from collections import (
+    defaultdict,
+    deque
+)
 import json
 import logging
 from datetime import (
@@ -40,6 +46,7 @@ from typing import (
 from flask import current_app
 
 # Local imports
+from backend.timestamps import TimestampMixin
 from backend.constants import DEFAULT_PROJECT_ZOOM
 from database import (
     DatabaseContext,
@@ -50,7 +57,7 @@ from database import (
 logger = logging.getLogger(__name__)
 
 
-class ProjectModel:
+class ProjectModel(TimestampMixin):
     """
     A data structure that represents a map project.
     This reflects the 'projects' table in the database.
@@ -75,6 +82,23 @@ class ProjectModel:
             Create project from dictionary
     """
 
+    # Fixed field layout. Slots skip the per-instance __dict__, so
+    #   attribute reads are descriptor loads, and every
+    #   project in a list response costs less memory
+    __slots__ = (
+        'id',
+        'name',
+        'description',
+        'center_lat',
+        'center_lon',
+        'zoom_level',
+        'tile_layer',
+        '_created_at',
+        '_updated_at',
+        '_created_at_iso',
+        '_updated_at_iso',
+    )
+
     def __init__(
         self,
         name: str,
@@ -112,23 +136,34 @@ class ProjectModel:
         self.zoom_level = zoom_level
         self.tile_layer = tile_layer
 
-        # Timestamps are in UTC
-        self.created_at = created_at or datetime.now(timezone.utc)
-        self.updated_at = updated_at or datetime.now(timezone.utc)
+        # Timestamps are in UTC. The clock is only read if one is
+        #   missing, and both share the same reading
+        if created_at is None or updated_at is None:
+            now = datetime.now(timezone.utc)
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
 
     def to_dict(
-        self
+        self,
+        iso_dates: bool = True
     ) -> Dict[str, Any]:
         """
         Convert project to dictionary representation.
+            Timestamps are formatted once, then reused on later calls
 
         Args:
-            None
+            iso_dates (bool): If True, timestamps are ISO strings.
+                If False, they are datetimes, for a JSON encoder that
+                handles them natively (orjson).
 
         Returns:
             Dict[str, Any]: Dictionary representation of the project
         """
 
+        created_at, updated_at = self._timestamps(iso_dates)
+
         return {
             'id': self.id,
             'name': self.name,
@@ -137,16 +172,8 @@ class ProjectModel:
             'center_lon': self.center_lon,
             'zoom_level': self.zoom_level,
             'tile_layer': self.tile_layer,
-            'created_at': (
-                self.created_at.isoformat()
-                if self.created_at
-                else None
-            ),
-            'updated_at': (
-                self.updated_at.isoformat()
-                if self.updated_at
-                else None
-            )
+            'created_at': created_at,
+            'updated_at': updated_at
         }
 
     @classmethod
@@ -193,11 +220,18 @@ class ProjectService:
     """
     Class for managing projects in the database.
 
+    Attributes:
+        PROJECT_FIELDS (List[str]): Project columns, in listed tuple order
+        BOUNDARY_FIELDS (List[str]): Boundary columns, in export order
+        ANNOTATION_FIELDS (List[str]): Annotation columns, in export order
+
     Methods:
         __init__:
             Initialize the class instance
         _row_to_model:
             Convert a database row to a ProjectModel
+        _order_map_areas:
+            Order map areas so parents come before their children
         create:
             Create a new project
         read:
@@ -208,6 +242,38 @@ class ProjectService:
             Delete a project
     """
 
+    # Columns streamed as tuples when listing projects (see read)
+    PROJECT_FIELDS = [
+        'id',
+        'name',
+        'description',
+        'center_lat',
+        'center_lon',
+        'zoom_level',
+        'created_at',
+        'updated_at',
+    ]
+
+    # Columns streamed as tuples during export (see export_project)
+    BOUNDARY_FIELDS = [
+        'id',
+        'map_area_id',
+        'coordinates',
+        'created_at',
+        'updated_at',
+        'layer_id',
+    ]
+    ANNOTATION_FIELDS = [
+        'id',
+        'layer_id',
+        'annotation_type',
+        'coordinates',
+        'style',
+        'content',
+        'created_at',
+        'updated_at',
+    ]
+
     def __init__(self) -> None:
         """
         Initialize the class instance.
@@ -221,29 +287,87 @@ class ProjectService:
 
     def _row_to_model(
         self,
-        row: Dict[str, Any]
+        row: Any
     ) -> ProjectModel:
         """
         Convert a database row to a ProjectModel.
 
         Args:
-            row (Dict[str, Any]): Database row
+            row (sqlite3.Row): Database row.
+                Used as-is, without copying to a dict
 
         Returns:
             ProjectModel: Project model instance
         """
 
+        # A row from UPDATE ... RETURNING can hold a whole number in a
+        #   REAL column as an int (see DatabaseManager.update), so ints
+        #   are made floats. Anything else is left as stored
+        center_lat = row['center_lat']
+        center_lon = row['center_lon']
+
         return ProjectModel(
             id=row['id'],
             name=row['name'],
             description=row['description'],
-            center_lat=row['center_lat'],
-            center_lon=row['center_lon'],
+            center_lat=(
+                float(center_lat) if isinstance(center_lat, int)
+                else center_lat
+            ),
+            center_lon=(
+                float(center_lon) if isinstance(center_lon, int)
+                else center_lon
+            ),
             zoom_level=row['zoom_level'],
             created_at=datetime.fromisoformat(row['created_at']),
             updated_at=datetime.fromisoformat(row['updated_at'])
         )
 
+    @staticmethod
+    def _order_map_areas(
+        areas: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Order map areas so parents come before their children.
+            An area's parent can change after it's created, so export
+            order (by ID) doesn't guarantee this.
+            The areas are indexed by parent in one pass, then the tree
+            is walked down from the top, with no repeated scans.
+
+        Args:
+            areas (List[Dict[str, Any]]): Map areas from an export
+
+        Returns:
+            List[Dict[str, Any]]: The same areas, parents first
+        """
+
+        area_ids = {area['id'] for area in areas}
+        children_of: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        for area in areas:
+            children_of[area.get('parent_id')].append(area)
+
+        # Top level areas have no parent in this export
+        queue = deque(
+            area
+            for area in areas
+            if area.get('parent_id') not in area_ids
+        )
+
+        ordered = []
+        while queue:
+            area = queue.popleft()
+            ordered.append(area)
+            queue.extend(children_of.pop(area['id'], ()))
+
+        # Anything left is part of a parent cycle, keep it in file order
+        if len(ordered) < len(areas):
+            placed = {id(area) for area in ordered}
+            ordered.extend(
+                area for area in areas if id(area) not in placed
+            )
+
+        return ordered
+
     def create(
         self,
         project: ProjectModel
@@ -310,50 +434,70 @@ class ProjectService:
                 list of projects otherwise
         """
 
+        # Read a single project by ID
+        if project_id:
+            try:
+                with DatabaseContext(
+                    self.db_path,
+                    read_only=True
+                ) as db_ctx:
+                    db_manager = DatabaseManager(db_ctx)
+                    row = db_manager.read(
+                        table="projects",
+                        fields=['*'],
+                        params={'id': project_id}
+                    )
+
+            except Exception as e:
+                logger.error(f"Error reading projects: {str(e)}")
+                raise
+
+            if row:
+                row = row[0] if isinstance(row, list) else row
+                return self._row_to_model(row)
+            return None
+
+        # List all projects, most recently updated first
+        #   Rows come back as tuples, and are unpacked by position
+        parse_time = datetime.fromisoformat
         try:
-            with DatabaseContext(self.db_path) as db_ctx:
+            with DatabaseContext(
+                self.db_path,
+                read_only=True
+            ) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
-
-                # Build query parameters
-                params = {'id': project_id} if project_id else {}
-                get_all = project_id is None
-
-                rows = db_manager.read(
-                    table="projects",
-                    fields=['*'],
-                    params=params,
-                    order_by=['updated_at'] if get_all else None,
-                    order_desc=True if get_all else False,
-                    get_all=get_all
-                )
+                return [
+                    ProjectModel(
+                        id=row_id,
+                        name=name,
+                        description=description,
+                        center_lat=center_lat,
+                        center_lon=center_lon,
+                        zoom_level=zoom_level,
+                        created_at=parse_time(created_at),
+                        updated_at=parse_time(updated_at)
+                    )
+                    for (
+                        row_id,
+                        name,
+                        description,
+                        center_lat,
+                        center_lon,
+                        zoom_level,
+                        created_at,
+                        updated_at
+                    ) in db_manager.iter_rows(
+                        table="projects",
+                        fields=self.PROJECT_FIELDS,
+                        order_by=['updated_at'],
+                        order_desc=True
+                    )
+                ]
 
         except Exception as e:
             logger.error(f"Error reading projects: {str(e)}")
             raise
 
-        # Handle single project case
-        if project_id:
-            row_dict = {}
-            if rows:
-                row = rows[0] if isinstance(rows, list) else rows
-                for key in row.keys():
-                    row_dict[key] = row[key]
-                return self._row_to_model(row_dict)
-            return None
-
-        # Handle multiple projects case
-        projects = []
-        if rows:
-            for row in rows:
-                # Convert Row to dict with proper types
-                row_dict = {
-                    str(key): row[key]
-                    for key in row.keys()
-                }
-                projects.append(self._row_to_model(row_dict))
-
-        return projects
-
     def update(
         self,
         project_id: int,
@@ -388,47 +532,27 @@ class ProjectService:
         # Always update the updated_at timestamp
         all_fields["updated_at"] = "CURRENT_TIMESTAMP"
 
+        # Update the project in the database
+        #   The UPDATE returns the new row, so there's no second query
         try:
             with DatabaseContext(self.db_path) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
-                db_manager.update(
+                row = db_manager.update(
                     table="projects",
                     fields=all_fields,
                     parameters={
                         'id': project_id
                     },
+                    returning=True
                 )
         except Exception as e:
             logger.error(f"Error updating project: {str(e)}")
             raise
 
-        # Read the updated project from the DB
-        try:
-            with DatabaseContext(self.db_path) as db_ctx:
-                db_manager = DatabaseManager(db_ctx)
-                row = db_manager.read(
-                    table="projects",
-                    fields=['*'],
-                    params={
-                        'id': project_id
-                    }
-                )
-
-        except Exception as e:
-            logger.error(f"Error reading updated project: {str(e)}")
-            raise
-
-        if row:
-            # Handle the case where row might be a list
-            if isinstance(row, list):
-                if len(row) > 0:
-                    return self._row_to_model(dict(row[0]))
-                return None
-
-            # Handle the case where row is a single row
-            return self._row_to_model(dict(row))
+        if not row:
+            return None
 
-        return None
+        return self._row_to_model(row)
 
     def delete(
         self,
@@ -477,7 +601,10 @@ class ProjectService:
         """
 
         try:
-            with DatabaseContext(self.db_path) as db_ctx:
+            with DatabaseContext(
+                self.db_path,
+                read_only=True
+            ) as db_ctx:
                 db_manager = DatabaseManager(db_ctx)
 
                 # Get project data
@@ -496,11 +623,12 @@ class ProjectService:
                     else dict(project_row[0])
                 )
 
-                # Get all map areas
+                # Get all map areas, in creation order
                 map_areas = db_manager.read(
                     table="map_areas",
                     fields=['*'],
                     params={'project_id': project_id},
+                    order_by=['id'],
                     get_all=True
                 )
 
@@ -515,22 +643,22 @@ class ProjectService:
                         map_areas_list.append(area_dict)
 
                         # Get boundary for this map area
-                        boundary = db_manager.read(
-                            table="boundaries",
-                            fields=['*'],
-                            params={'map_area_id': area_dict['id']},
-                            get_all=True
+                        boundaries_list.extend(
+                            dict(zip(self.BOUNDARY_FIELDS, row))
+                            for row in db_manager.iter_rows(
+                                table="boundaries",
+                                fields=self.BOUNDARY_FIELDS,
+                                params={'map_area_id': area_dict['id']}
+                            )
                         )
 
-                        if boundary:
-                            for b in boundary:
-                                boundaries_list.append(dict(b))
-
-                        # Get layers for this map area
+                        # Get layers for this map area, in creation order
+                        #   (explicit, as the chosen index sets it otherwise)
                         layers = db_manager.read(
                             table="layers",
                             fields=['*'],
                             params={'map_area_id': area_dict['id']},
+                            order_by=['id'],
                             get_all=True
                         )
 
@@ -554,17 +682,15 @@ class ProjectService:
                                 layers_list.append(layer_dict)
 
                                 # Get annotations for this layer
-                                annotations = db_manager.read(
-                                    table="annotations",
-                                    fields=['*'],
-                                    params={'layer_id': layer_dict['id']},
-                                    get_all=True
+                                annotations_list.extend(
+                                    dict(zip(self.ANNOTATION_FIELDS, row))
+                                    for row in db_manager.iter_rows(
+                                        table="annotations",
+                                        fields=self.ANNOTATION_FIELDS,
+                                        params={'layer_id': layer_dict['id']}
+                                    )
                                 )
 
-                                if annotations:
-                                    for ann in annotations:
-                                        annotations_list.append(dict(ann))
-
                 # Construct export data
                 export_data = {
                     'version': '1.0',
@@ -629,7 +755,9 @@ class ProjectService:
 
                 # Import map areas
                 if 'map_areas' in import_data:
-                    for area in import_data['map_areas']:
+                    for area in self._order_map_areas(
+                        import_data['map_areas']
+                    ):
                         old_area_id = area['id']
 
                         new_area = {
@@ -661,25 +789,28 @@ class ProjectService:
                 if 'boundaries' in import_data:
                     # Track which map areas have boundaries
                     boundary_map_areas = set()
+                    new_boundaries = []
 
                     for boundary in import_data['boundaries']:
                         old_map_area_id = boundary['map_area_id']
                         new_map_area_id = map_area_id_map.get(old_map_area_id)
 
                         if new_map_area_id:
-                            new_boundary = {
-                                'map_area_id': new_map_area_id,
-                                'coordinates': boundary['coordinates']
-                            }
-
-                            # Note: layer_id set after creating boundary layers
-                            db_manager.create(
-                                table="boundaries",
-                                params=new_boundary
+                            new_boundaries.append(
+                                {
+                                    'map_area_id': new_map_area_id,
+                                    'coordinates': boundary['coordinates']
+                                }
                             )
 
                             boundary_map_areas.add(new_map_area_id)
 
+                    # Note: layer_id set after creating boundary layers
+                    db_manager.create_many(
+                        table="boundaries",
+                        rows=new_boundaries
+                    )
+
                     # Determine which map areas already have a boundary layer
                     # in the export (old area ID -> bool). If a boundary layer
                     # is present in the layers list we must NOT create a
@@ -774,26 +905,31 @@ class ProjectService:
 
                 # Import annotations
                 if 'annotations' in import_data:
+                    new_annotations = []
+
                     for annotation in import_data['annotations']:
                         old_layer_id = annotation['layer_id']
                         new_layer_id = layer_id_map.get(old_layer_id)
 
                         if new_layer_id:
-                            new_annotation = {
-                                'layer_id': new_layer_id,
-                                'annotation_type': annotation[
-                                    'annotation_type'
-                                ],
-                                'coordinates': annotation['coordinates'],
-                                'style': annotation.get('style'),
-                                'content': annotation.get('content')
-                            }
-
-                            db_manager.create(
-                                table="annotations",
-                                params=new_annotation
+                            new_annotations.append(
+                                {
+                                    'layer_id': new_layer_id,
+                                    'annotation_type': annotation[
+                                        'annotation_type'
+                                    ],
+                                    'coordinates': annotation['coordinates'],
+                                    'style': annotation.get('style'),
+                                    'content': annotation.get('content')
+                                }
                             )
 
+                    # Annotation IDs aren't referenced, so insert in bulk
+                    db_manager.create_many(
+                        table="annotations",
+                        rows=new_annotations
+                    )
+
                 if new_project_id is None:
                     raise ValueError("Failed to create project")
 
@@ -0,0 +1,132 @@
+"""
+Module: backend.timestamps
+
+Shared timestamp handling for the data models.
+
+Classes:
+    TimestampMixin:
+        Creation and update timestamps, with cached ISO strings
+"""
+
+
+# Standard library imports
+from datetime import datetime
+from typing import (
+    Any,
+    Optional,
+    Tuple
+)
+
+
+class TimestampMixin:
+    """
+    Creation and update timestamps, with cached ISO strings.
+        Formatting a datetime is done once, then reused each time the
+        model is converted to a dictionary.
+        Setting a timestamp drops its cached string.
+
+    The model declares the storage in its own __slots__:
+        _created_at, _updated_at, _created_at_iso, _updated_at_iso
+
+    Attributes:
+        created_at (Optional[datetime]): Creation timestamp
+        updated_at (Optional[datetime]): Last update timestamp
+
+    Methods:
+        _timestamps:
+            Get both timestamps, as ISO strings or datetimes
+    """
+
+    # No storage here, so models keep a fixed layout
+    __slots__ = ()
+
+    @property
+    def created_at(
+        self
+    ) -> Optional[datetime]:
+        """
+        Creation timestamp.
+
+        Returns:
+            Optional[datetime]: When the record was created
+        """
+
+        return self._created_at
+
+    @created_at.setter
+    def created_at(
+        self,
+        value: Optional[datetime]
+    ) -> None:
+        """
+        Set the creation timestamp, dropping the cached ISO string.
+
+        Args:
+            value (Optional[datetime]): New creation timestamp
+
+        Returns:
+            None
+        """
+
+        self._created_at = value
+        self._created_at_iso = None
+
+    @property
+    def updated_at(
+        self
+    ) -> Optional[datetime]:
+        """
+        Last update timestamp.
+
+        Returns:
+            Optional[datetime]: When the record was last updated
+        """
+
+        return self._updated_at
+
+    @updated_at.setter
+    def updated_at(
+        self,
+        value: Optional[datetime]
+    ) -> None:
+        """
+        Set the update timestamp, dropping the cached ISO string.
+
+        Args:
+            value (Optional[datetime]): New update timestamp
+
+        Returns:
+            None
+        """
+
+        self._updated_at = value
+        self._updated_at_iso = None
+
+    def _timestamps(
+        self,
+        iso_dates: bool = True
+    ) -> Tuple[Any, Any]:
+        """
+        Get both timestamps, for a dictionary representation.
+            ISO strings are formatted on first use, then cached.
+
+        Args:
+            iso_dates (bool): If True, timestamps are ISO strings.
+                If False, they are datetimes, for a JSON encoder that
+                handles them natively (orjson).
+
+        Returns:
+            Tuple[Any, Any]:
+                The created and updated timestamps, or None if unset
+        """
+
+        if not iso_dates:
+            return self._created_at, self._updated_at
+
+        if self._created_at_iso is None and self._created_at:
+            self._created_at_iso = self._created_at.isoformat()
+
+        if self._updated_at_iso is None and self._updated_at:
+            self._updated_at_iso = self._updated_at.isoformat()
+
+        return self._created_at_iso, self._updated_at_iso
@@ -0,0 +1,73 @@
+"""
+Module: backend.validation
+
+Checks on request bodies, shared by the API routes.
+
+Functions:
+    first_missing_field:
+        Find the first required field missing from a request body
+    first_non_numeric_field:
+        Find the first field in a request body that isn't a number
+"""
+
+
+# Standard library imports
+from typing import (
+    Any,
+    Optional,
+    Tuple
+)
+
+
+def first_missing_field(
+    data: Any,
+    required: Tuple[str, ...]
+) -> Optional[str]:
+    """
+    Find the first required field missing from a request body.
+        Fields are checked in order, so the error always names the
+        same field for the same body.
+
+    Args:
+        data (Any): The parsed JSON body
+        required (Tuple[str, ...]): Required field names, in the order
+            errors should be reported in
+
+    Returns:
+        Optional[str]: The first missing field, or None if all are there
+    """
+
+    for field in required:
+        if field not in data:
+            return field
+
+    return None
+
+
+def first_non_numeric_field(
+    data: Any,
+    fields: Tuple[str, ...]
+) -> Optional[str]:
+    """
+    Find the first field in a request body that isn't a number.
+        Only fields that are present are checked, and None is allowed.
+        Booleans are rejected, even though Python counts them as ints.
+
+    Args:
+        data (Any): The parsed JSON body
+        fields (Tuple[str, ...]): Numeric field names, in the order
+            errors should be reported in
+
+    Returns:
+        Optional[str]: The first non-numeric field, or None if all are
+            numbers
+    """
+
+    for field in fields:
+        value = data.get(field) if isinstance(data, dict) else None
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return field
+
+    return None
@@ -2,10 +2,12 @@
 Database initialization and management.
 """
 
+from .database import ConnectionPool
 from .database import DatabaseContext
 from .database import DatabaseManager
 
 __all__ = [
+    'ConnectionPool',
     'DatabaseContext',
     'DatabaseManager',
 ]
@@ -2,24 +2,369 @@
 Database connection and initialization.
 
 Classes:
+    ConnectionPool:
+        Pool of reusable SQLite connections for one database file.
     DatabaseContext:
         Context manager for SQLite database connections.
-    Database:
+    DatabaseManager:
         SQLite database manager for the maps application.
 """
 
 import sqlite3
 import os
 import logging
+import functools
+import queue
+import threading
+import time
+from pathlib import Path
+from urllib.request import pathname2url
 from typing import (
     Optional,
     List,
     Union,
     Dict,
+    Tuple,
+    Iterable,
+    Iterator,
     Any
 )
 
 
+def _split_statements(
+    script: str
+) -> Tuple[str, ...]:
+    """
+    Split an SQL script into individual statements.
+        Uses sqlite's own parser to find statement ends, so semicolons
+        inside strings or trigger bodies don't split a statement.
+
+    Args:
+        script (str): The SQL script
+
+    Returns:
+        Tuple[str, ...]: Complete statements, in order
+    """
+
+    statements = []
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+
+    return tuple(statements)
+
+
+# The schema is read and split once at import, not every time a database
+#   is initialised. The test suite builds a fresh database per test
+SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+_SCHEMA_SQL = SCHEMA_PATH.read_text(encoding="utf-8")
+_SCHEMA_STATEMENTS = _split_statements(_SCHEMA_SQL)
+
+# Compiled statements kept per connection (sqlite3 default is 128)
+#   The generated CRUD queries vary by table and field set, so allow
+#   plenty of room before statements are evicted and recompiled
+STATEMENT_CACHE_SIZE = 256
+
+# Connection settings, applied each time a connection is opened
+#   WAL lets readers carry on while a write is in progress
+#   synchronous=NORMAL is safe with WAL, and halves the fsyncs per commit
+#   A 64MB page cache (negative = KiB) and mmap keep reads out of the disk
+#   busy_timeout waits on a locked database, rather than failing at once
+_PRAGMAS = (
+    "journal_mode = WAL",
+    "synchronous = NORMAL",
+    "temp_store = MEMORY",
+    "cache_size = -64000",
+    "mmap_size = 268435456",
+    "busy_timeout = 5000",
+    "foreign_keys = ON",
+)
+
+# Generated SQL kept per query shape (table, fields, filters, ordering)
+#   The app only uses a few dozen shapes, so this never really fills up
+SQL_CACHE_SIZE = 256
+
+# Idle connections kept open per database file
+#   More can be opened when busy, they're closed when returned to a full pool
+POOL_SIZE = os.cpu_count() or 4
+
+# Planner statistics upkeep ('PRAGMA optimize', as SQLite recommends)
+#   Runs when a connection closes, and hourly on long-lived pooled ones
+#   A bulk insert of this many rows re-analyzes the table straight away
+OPTIMIZE_INTERVAL = 3600
+BULK_ANALYZE_ROWS = 10_000
+
+# Rows sampled per index when analyzing at startup
+#   An approximate ANALYZE, so a large database doesn't slow down boot
+STARTUP_ANALYSIS_LIMIT = 400
+
+# UPDATE ... RETURNING hands back the changed row (SQLite 3.35+)
+#   Older libraries read the row back with a SELECT instead
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+class ConnectionPool:
+    """
+    Pool of open connections to a single SQLite database file.
+        Opening a connection and applying the PRAGMAs costs more than
+        most of the queries this app runs, so connections are reused.
+
+    Attributes:
+        db_path (str): Path to the SQLite database file
+        read_only (bool): Whether connections are opened read-only
+        size (int): Maximum number of idle connections to keep
+        pid (int): Process that created the pool
+        write_lock (threading.Lock): Held while a write transaction is open
+        writer (Optional[int]): Thread holding write_lock, if any
+
+    Methods:
+        for_path:
+            Get the shared pool for a database file
+        close_all:
+            Close every pool
+        acquire:
+            Check out a connection
+        release:
+            Return a connection to the pool
+        _optimize:
+            Refresh planner statistics
+        _close_connection:
+            Optimize and close a connection
+        close:
+            Close all idle connections
+    """
+
+    _pools: Dict[Tuple[str, bool], 'ConnectionPool'] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_path: str,
+        read_only: bool = False,
+        size: int = POOL_SIZE
+    ) -> None:
+        """
+        Initialize an empty pool. Connections are opened on demand.
+
+        Args:
+            db_path (str): Path to the SQLite database file
+            read_only (bool): Open connections read-only
+            size (int): Maximum number of idle connections to keep
+
+        Returns:
+            None
+        """
+
+        self.db_path = db_path
+        self.read_only = read_only
+        self.size = size
+        self.pid = os.getpid()
+
+        # LIFO, so the most recently used (warm cache) connection is reused
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+
+        # SQLite allows one writer at a time. Queue writers here, rather
+        #   than have them collide in sqlite and spin on SQLITE_BUSY
+        #   The owning thread is recorded, so a nested writer in that
+        #   thread fails at once instead of waiting on itself
+        self.write_lock = threading.Lock()
+        self.writer: Optional[int] = None
+
+        self._last_optimize = time.monotonic()
+
+    @classmethod
+    def for_path(
+        cls,
+        db_path: str,
+        read_only: bool = False
+    ) -> 'ConnectionPool':
+        """
+        Get the shared pool for a database file, creating it if needed.
+
+        Args:
+            db_path (str): Path to the SQLite database file
+            read_only (bool): Get the pool of read-only connections
+
+        Returns:
+            ConnectionPool: The pool for this file
+        """
+
+        key = (db_path, read_only)
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+
+            # SQLite connections must not be used across a fork
+            #   (gunicorn workers), so each process gets its own pool
+            if pool is None or pool.pid != os.getpid():
+                pool = cls(db_path, read_only)
+                cls._pools[key] = pool
+
+            return pool
+
+    @classmethod
+    def close_all(
+        cls
+    ) -> None:
+        """
+        Close every pool, and forget them.
+
+        Returns:
+            None
+        """
+
+        with cls._pools_lock:
+            for pool in cls._pools.values():
+                pool.close()
+            cls._pools.clear()
+
+    def _connect(
+        self
+    ) -> sqlite3.Connection:
+        """
+        Open a new connection, and apply the connection settings.
+
+        Returns:
+            sqlite3.Connection: The new connection
+        """
+
+        # Pooled connections may be handed to a different thread later
+        #   The pool makes sure only one thread uses each at a time
+        # Autocommit mode (isolation_level=None) stops sqlite3 from
+        #   opening transactions behind our back. DatabaseContext starts
+        #   one explicitly for writes, so all writes in a context share
+        #   a single commit
+        # Read-only connections skip write locking entirely, and any
+        #   attempt to write through one fails with SQLITE_READONLY
+        database = self.db_path
+        if self.read_only:
+            path = pathname2url(os.path.abspath(self.db_path))
+            database = f"file:{path}?mode=ro"
+
+        conn = sqlite3.connect(
+            database,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+            isolation_level=None,
+            uri=self.read_only
+        )
+        conn.row_factory = sqlite3.Row
+
+        for pragma in _PRAGMAS:
+            # The journal mode is a property of the file, set by writers
+            if self.read_only and pragma.startswith("journal_mode"):
+                continue
+            conn.execute(f"PRAGMA {pragma}")
+
+        return conn
+
+    def acquire(
+        self
+    ) -> sqlite3.Connection:
+        """
+        Check out a connection, opening a new one if none are idle.
+            This never blocks, so a context opened inside another one
+            gets its own connection. Only one of them may write,
+            see DatabaseContext.begin_write().
+
+        Returns:
+            sqlite3.Connection: A connection for exclusive use
+        """
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release(
+        self,
+        conn: sqlite3.Connection
+    ) -> None:
+        """
+        Return a connection to the pool.
+            Connections beyond the pool size are closed.
+
+        Args:
+            conn (sqlite3.Connection): The connection to return
+
+        Returns:
+            None
+        """
+
+        # Never hand out a connection with a transaction still open
+        if conn.in_transaction:
+            conn.rollback()
+
+        # Pooled connections rarely close, so optimize now and then
+        if time.monotonic() - self._last_optimize > OPTIMIZE_INTERVAL:
+            self._last_optimize = time.monotonic()
+            self._optimize(conn)
+
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._close_connection(conn)
+
+    def _optimize(
+        self,
+        conn: sqlite3.Connection
+    ) -> None:
+        """
+        Run 'PRAGMA optimize', to refresh stale planner statistics.
+            Usually a no-op. Skipped on read-only connections, which
+            can't store the statistics.
+
+        Args:
+            conn (sqlite3.Connection): The connection to optimize
+
+        Returns:
+            None
+        """
+
+        if self.read_only:
+            return
+
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logging.warning("PRAGMA optimize failed: %s", e)
+
+    def _close_connection(
+        self,
+        conn: sqlite3.Connection
+    ) -> None:
+        """
+        Optimize, then close a connection.
+
+        Args:
+            conn (sqlite3.Connection): The connection to close
+
+        Returns:
+            None
+        """
+
+        self._optimize(conn)
+        conn.close()
+
+    def close(
+        self
+    ) -> None:
+        """
+        Close all idle connections.
+
+        Returns:
+            None
+        """
+
+        while True:
+            try:
+                self._close_connection(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
 class DatabaseContext:
     """
     Database context manager for SQLite DB.
@@ -27,10 +372,18 @@ class DatabaseContext:
     Attributes:
         db_path (str):
             Path to the SQLite database file
+        pool (ConnectionPool):
+            Pool the connection is borrowed from
+        conn (sqlite3.Connection):
+            The borrowed connection
+        cursor (sqlite3.Cursor):
+            Cursor used for this context
 
     Methods:
         __init__:
             Initialize DatabaseContext
+        begin_write:
+            Start the write transaction
         __enter__:
             Start context manager
         __exit__:
@@ -39,23 +392,67 @@ class DatabaseContext:
 
     def __init__(
         self,
-        db_path: str
+        db_path: str,
+        read_only: bool = False
     ) -> None:
         """
         Initialize the DatabaseContext instance.
 
         Args:
             db_path (str): Path to the SQLite database file
+            read_only (bool): Use a read-only connection. Only for
+                contexts that never write. The database must exist.
 
         Returns:
             None
         """
 
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
-        self.conn.row_factory = sqlite3.Row
+        self.pool = ConnectionPool.for_path(db_path, read_only)
+        self.conn = self.pool.acquire()
         self.cursor = self.conn.cursor()
-        self.conn.execute("PRAGMA foreign_keys = ON")
+        self._writing = False
+
+    def begin_write(
+        self
+    ) -> None:
+        """
+        Start the write transaction for this context, if not started yet.
+            Takes the pool's write lock, then BEGIN IMMEDIATE, so the
+            write lock in sqlite is held from the start. A deferred
+            transaction that upgrades from read to write can fail with
+            SQLITE_BUSY straight away, without waiting.
+            The lock is released when the context exits.
+
+        Write contexts must not nest. An inner context has its own
+        connection, so its BEGIN IMMEDIATE would wait on the outer
+        context's transaction until busy_timeout, then fail.
+        Do all the writes through the outer context instead.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If this thread is already writing through
+                another context on the same database
+        """
+
+        if self._writing:
+            return
+
+        if self.pool.writer == threading.get_ident():
+            raise RuntimeError(
+                "A write context is already open in this thread. "
+                "Nested write contexts would deadlock; "
+                "write through the outer context instead."
+            )
+
+        self.pool.write_lock.acquire()
+        self.pool.writer = threading.get_ident()
+        self._writing = True
+
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
 
     def __enter__(
         self
@@ -90,14 +487,18 @@ class DatabaseContext:
             None
         """
 
-        # Commit or rollback
-        if exc_type:
-            self.conn.rollback()
-        else:
-            self.conn.commit()
+        # The connection's own context manager commits on success and
+        #   rolls back on error. Return it even if the commit fails
+        try:
+            self.conn.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self.cursor.close()
+            self.pool.release(self.conn)
 
-        # Close the connection
-        self.conn.close()
+            if self._writing:
+                self._writing = False
+                self.pool.writer = None
+                self.pool.write_lock.release()
 
 
 class DatabaseManager:
@@ -113,12 +514,26 @@ class DatabaseManager:
             Initialize DatabaseManager
         initialise:
             Create database tables and indexes if they don't exist
+        _check_identifiers:
+            Validate table and column names
+        _create_sql:
+            Build (and cache) an INSERT query
         create:
             Create a new record in the database
+        create_many:
+            Create many records with a single prepared query
+        _read_sql:
+            Build (and cache) a SELECT query
         read:
             Read one or more records from the database
+        iter_rows:
+            Stream records as plain tuples
+        _update_sql:
+            Build (and cache) an UPDATE query
         update:
             Update an existing record in the database
+        _delete_sql:
+            Build (and cache) a DELETE query
         delete:
             Delete a record from the database
     """
@@ -143,14 +558,14 @@ class DatabaseManager:
 
     def initialise(
         self,
-        schema_file: str = "database/schema.sql"
+        schema_file: Optional[str] = None
     ) -> None:
         """
         Create database tables and indexes if they don't exist.
-        Reads the schema from an sql script file.
+        Uses the bundled schema, unless another sql script is given.
 
         Args:
-            schema_file (str): Path to the SQL schema file
+            schema_file (Optional[str]): Path to an alternate SQL schema
 
         Returns:
             None
@@ -167,55 +582,130 @@ class DatabaseManager:
             logging.error(f"Error creating database directory: {e}")
             raise
 
-        # Read schema SQL from file
+        # Use the cached schema, or read an alternate one from file
         try:
-            with open(schema_file, "r", encoding="utf-8") as f:
-                schema_sql = f.read()
-
-            self.db.cursor.executescript(schema_sql)
+            statements = _SCHEMA_STATEMENTS
+            if schema_file is not None:
+                with open(schema_file, "r", encoding="utf-8") as f:
+                    statements = _split_statements(f.read())
+
+            # One transaction for the whole schema. executescript()
+            #   would commit first, then run each statement on its own
+            self.db.begin_write()
+            for statement in statements:
+                self.db.cursor.execute(statement)
             self.db.conn.commit()
 
         except Exception as e:
             logging.error(f"Error initializing database schema: {e}")
             raise
 
+        # Gather planner statistics, so the first queries use the indexes
+        #   'PRAGMA optimize' alone skips tables this connection hasn't
+        #   queried yet, which at startup is all of them
+        try:
+            self.db.cursor.execute(
+                f"PRAGMA analysis_limit = {STARTUP_ANALYSIS_LIMIT}"
+            )
+            self.db.cursor.execute("ANALYZE")
+
+        except sqlite3.Error as e:
+            logging.warning("Startup ANALYZE failed: %s", e)
+
+        finally:
+            # The connection goes back to the pool, later ANALYZE runs
+            #   should be exact again
+            self.db.cursor.execute("PRAGMA analysis_limit = 0")
+
         logging.info("Database initialized successfully.")
 
+    @staticmethod
+    def _check_identifiers(
+        names: Iterable[str],
+        allow_star: bool = False
+    ) -> None:
+        """
+        Make sure table and column names are plain identifiers.
+            Names are written into the SQL text (only values are bound),
+            so anything else is rejected. The builders are cached, so
+            this runs once per query shape.
+
+        Args:
+            names (Iterable[str]): Table or column names
+            allow_star (bool): Allow '*' (select all fields)
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a name is not a valid identifier
+        """
+
+        for name in names:
+            if allow_star and name == '*':
+                continue
+
+            if not isinstance(name, str) or not name.isidentifier():
+                raise ValueError(f"Invalid SQL identifier: {name!r}")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+    def _create_sql(
+        table: str,
+        columns: Tuple[str, ...]
+    ) -> str:
+        """
+        Build an INSERT query. Results are cached by query shape.
+
+        Args:
+            table (str): The table to insert into
+            columns (Tuple[str, ...]): The columns to insert
+
+        Returns:
+            str: The SQL query
+        """
+
+        DatabaseManager._check_identifiers((table, *columns))
+
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(['?'] * len(columns))})"
+        )
+
     def create(
         self,
         table: str,
-        params: dict = {}
+        params: Optional[Dict[str, Any]] = None
     ) -> Optional[int]:
         """
         Create a new record in the database.
 
         Args:
             table (str): The table to insert into
-            params (dict): A dictionary of column names and values to insert.
+            params (Optional[Dict[str, Any]]):
+                A dictionary of column names and values to insert.
 
         Returns:
             Optional[int]: The ID of the created record.
         """
 
+        params = params or {}
+
         # The list of values to insert
-        parameters = []
+        parameters = list(params.values())
 
         # Build the full query
-        full_query = (
-            f"INSERT INTO {table} ("
+        full_query = self._create_sql(
+            table,
+            tuple(params)
         )
 
-        for key, value in params.items():
-            full_query += f"{key}, "
-            parameters.append(value)
-
-        full_query = full_query.rstrip(", ") + ") VALUES ("
-
-        full_query += ", ".join(["?"] * len(params)) + ")"
-
         # Execute the query
+        self.db.begin_write()
         logging.debug(
-            f"Executing create query: {full_query} with params: {parameters}"
+            "Executing create query: %s with params: %s",
+            full_query,
+            parameters
         )
         result = self.db.cursor.execute(
             full_query,
@@ -225,11 +715,127 @@ class DatabaseManager:
         # Return the last inserted ID
         return result.lastrowid
 
+    def create_many(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 1000
+    ) -> int:
+        """
+        Create many records in the database, with one prepared INSERT.
+            The query is built once, and rows are sent with executemany.
+            All rows are written in the context's transaction, so there
+            is a single commit, rather than a round-trip per row.
+
+        Args:
+            table (str): The table to insert into
+            rows (List[Dict[str, Any]]): The records to insert.
+                Every record must have the same columns.
+            batch_size (int): Rows sent to sqlite per executemany call
+
+        Returns:
+            int: The number of records created
+
+        Raises:
+            ValueError: If the records don't all have the same columns
+        """
+
+        if not rows:
+            return 0
+
+        columns = tuple(rows[0])
+        for row in rows:
+            if tuple(row) != columns:
+                raise ValueError(
+                    f"All rows must have the columns {columns}, "
+                    f"got {tuple(row)}"
+                )
+
+        query = self._create_sql(
+            table,
+            columns
+        )
+
+        logging.debug(
+            "Executing bulk create query: %s for %d rows",
+            query,
+            len(rows)
+        )
+
+        self.db.begin_write()
+        created = 0
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            self.db.cursor.executemany(
+                query,
+                [tuple(row.values()) for row in batch],
+            )
+            created += len(batch)
+
+        # A large load changes the table's shape, so refresh statistics
+        #   now, rather than plan the next queries on stale ones
+        if created >= BULK_ANALYZE_ROWS:
+            self.db.cursor.execute(f"ANALYZE {table}")
+
+        return created
+
+    @staticmethod
+    @functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+    def _read_sql(
+        table: str,
+        fields: Tuple[str, ...],
+        where: Tuple[Tuple[str, bool], ...],
+        order_by: Optional[Tuple[str, ...]],
+        order_desc: bool,
+        has_limit: bool
+    ) -> str:
+        """
+        Build a SELECT query. Results are cached by query shape.
+            Repeated reads skip building the string, and the identical
+            SQL text always hits sqlite3's compiled statement cache.
+
+        Args:
+            table (str): The table to read from.
+            fields (Tuple[str, ...]): The fields to retrieve.
+            where (Tuple[Tuple[str, bool], ...]):
+                Filter columns, and whether each one is 'IS NULL'.
+            order_by (Optional[Tuple[str, ...]]): Fields to order by.
+            order_desc (bool): If True, order results in descending order.
+            has_limit (bool): If True, add a bound LIMIT parameter.
+
+        Returns:
+            str: The SQL query
+        """
+
+        DatabaseManager._check_identifiers((table,))
+        DatabaseManager._check_identifiers(fields, allow_star=True)
+        DatabaseManager._check_identifiers(key for key, _ in where)
+        DatabaseManager._check_identifiers(order_by or ())
+
+        query = f"SELECT {', '.join(fields)} FROM {table}"
+
+        if where:
+            query += " WHERE " + " AND ".join(
+                f"{key} IS NULL" if is_null else f"{key} = ?"
+                for key, is_null in where
+            )
+
+        if order_by:
+            query += " ORDER BY " + ", ".join(order_by)
+            if order_desc:
+                query += " DESC"
+
+        # Bound, so every limit value shares one compiled statement
+        if has_limit:
+            query += " LIMIT ?"
+
+        return query
+
     def read(
         self,
         table: str,
         fields: List[str],
-        params: dict = {},
+        params: Optional[Dict[str, Any]] = None,
         order_by: Optional[list[str]] = None,
         order_desc: bool = False,
         limit: Optional[int] = None,
@@ -241,7 +847,8 @@ class DatabaseManager:
         Args:
             table (str): The table to read from.
             fields (List[str]): The fields to retrieve.
-            params (dict): A dictionary of column names and values to filter.
+            params (Optional[Dict[str, Any]]):
+                A dictionary of column names and values to filter.
             order_by (Optional[list[str]]): Fields to order the results by.
             order_desc (bool): If True, order results in descending order.
             limit (Optional[int]): Maximum number of records to fetch.
@@ -252,33 +859,36 @@ class DatabaseManager:
                 The fetched record or None.
         """
 
-        parameters = []
-
-        # Build query
-        query = f"SELECT {', '.join(fields)} FROM {table} "
-
-        if params:
-            query += "WHERE "
-
-        for key, value in params.items():
-            if value == 'NULL':
-                query += f"{key} IS NULL AND "
-            else:
-                query += f"{key} = ? AND "
-                parameters.append(value)
-        query = query.rstrip(" AND ")
-
-        if order_by:
-            query += " ORDER BY " + ", ".join(order_by)
-            if order_desc:
-                query += " DESC"
+        params = params or {}
 
+        # Filter values are bound, the SQL only depends on the keys
+        where = tuple(
+            (key, value == 'NULL')
+            for key, value in params.items()
+        )
+        parameters = [
+            value
+            for value in params.values()
+            if value != 'NULL'
+        ]
+
+        # Build query (or reuse one built earlier for the same shape)
+        query = self._read_sql(
+            table,
+            tuple(fields),
+            where,
+            tuple(order_by) if order_by else None,
+            order_desc,
+            limit is not None
+        )
         if limit is not None:
-            query += f" LIMIT {limit}"
+            parameters.append(limit)
 
         # Execute the query
         logging.debug(
-            f"Executing read query: {query} with params: {parameters}"
+            "Executing read query: %s with params: %s",
+            query,
+            parameters
         )
         result = self.db.cursor.execute(
             query,
@@ -292,12 +902,118 @@ class DatabaseManager:
         else:
             return result.fetchone()
 
+    def iter_rows(
+        self,
+        table: str,
+        fields: List[str],
+        params: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        order_desc: bool = False,
+        chunk_size: int = 1000
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Stream records from the database as plain tuples.
+            For bulk reads that don't need column access by name.
+            Tuples skip building an sqlite3.Row (with its name lookup)
+            for every record, and rows are fetched in chunks.
+
+        Args:
+            table (str): The table to read from.
+            fields (List[str]): The fields to retrieve, in tuple order.
+            params (Optional[Dict[str, Any]]):
+                A dictionary of column names and values to filter.
+            order_by (Optional[List[str]]): Fields to order the results by.
+            order_desc (bool): If True, order results in descending order.
+            chunk_size (int): Records fetched from sqlite at a time.
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: One tuple per record
+        """
+
+        params = params or {}
+
+        where = tuple(
+            (key, value == 'NULL')
+            for key, value in params.items()
+        )
+        parameters = [
+            value
+            for value in params.values()
+            if value != 'NULL'
+        ]
+
+        query = self._read_sql(
+            table,
+            tuple(fields),
+            where,
+            tuple(order_by) if order_by else None,
+            order_desc,
+            False
+        )
+
+        logging.debug(
+            "Executing bulk read query: %s with params: %s",
+            query,
+            parameters
+        )
+
+        # A separate cursor, so the context's cursor keeps its row factory
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+        cursor.arraysize = chunk_size
+        try:
+            cursor.execute(
+                query,
+                parameters,
+            )
+            while rows := cursor.fetchmany():
+                yield from rows
+        finally:
+            cursor.close()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+    def _update_sql(
+        table: str,
+        fields: Tuple[Tuple[str, bool], ...],
+        where: Tuple[str, ...],
+        returning: bool = False
+    ) -> str:
+        """
+        Build an UPDATE query. Results are cached by query shape.
+
+        Args:
+            table (str): The table to update.
+            fields (Tuple[Tuple[str, bool], ...]):
+                Columns to set, and whether each is CURRENT_TIMESTAMP.
+            where (Tuple[str, ...]): Columns identifying the record.
+            returning (bool): Add a RETURNING clause for the whole row.
+
+        Returns:
+            str: The SQL query
+        """
+
+        DatabaseManager._check_identifiers((table, *where))
+        DatabaseManager._check_identifiers(key for key, _ in fields)
+
+        set_parts = (
+            f"{key} = CURRENT_TIMESTAMP" if is_timestamp else f"{key} = ?"
+            for key, is_timestamp in fields
+        )
+
+        return (
+            f"UPDATE {table} SET {', '.join(set_parts)} "
+            f"WHERE {' AND '.join(f'{key} = ?' for key in where)}"
+            f"{' RETURNING *' if returning else ''}"
+        )
+
     def update(
         self,
         table: str,
         fields: dict,
         parameters: Dict[str, Any],
-    ) -> None:
+        returning: bool = False,
+    ) -> Optional[sqlite3.Row]:
         """
         Update an existing record in the database.
 
@@ -306,39 +1022,98 @@ class DatabaseManager:
             fields (List[str]): The fields to update.
             parameters (Dict[str, Any]):
                 A dictionary of column names and values to identify the record.
+            returning (bool): If True, return the record as updated.
+                This comes from the UPDATE itself where SQLite supports
+                RETURNING, so the caller needn't read it back.
+                RETURNING skips column affinity on some versions
+                (3.40 among them), so a whole number stored in a REAL
+                column comes back as an int. Convert those with float().
 
         Returns:
-            None
+            Optional[sqlite3.Row]:
+                The updated record, if returning is set and it exists.
+                None otherwise.
         """
 
-        field_values = []
-        param_values = []
+        set_fields = []
+        values = []
 
-        update_string = f"UPDATE {table} SET "
         for key, value in fields.items():
-            if isinstance(value, str) and value.upper() == "CURRENT_TIMESTAMP":
-                update_string += f"{key} = CURRENT_TIMESTAMP, "
-            else:
-                update_string += f"{key} = ?, "
-                field_values.append(value)
-        update_string = update_string.rstrip(", ")
-
-        update_string += " WHERE "
-        for key, value in parameters.items():
-            update_string += f"{key} = ?"
-            param_values.append(value)
-
-        values = field_values + param_values
+            is_timestamp = (
+                isinstance(value, str)
+                and value.upper() == "CURRENT_TIMESTAMP"
+            )
+            set_fields.append((key, is_timestamp))
+            if not is_timestamp:
+                values.append(value)
+
+        # Record identifiers follow the new values
+        values.extend(parameters.values())
+
+        update_string = self._update_sql(
+            table,
+            tuple(set_fields),
+            tuple(parameters),
+            returning and HAS_RETURNING
+        )
 
         # Use update_string and values for execution
+        self.db.begin_write()
         logging.debug(
-            f"Executing update query: {update_string} with params: {values}"
+            "Executing update query: %s with params: %s",
+            update_string,
+            values
         )
         self.db.cursor.execute(
             update_string,
             values,
         )
 
+        if not returning:
+            return None
+
+        # Read the row back in the same transaction, on older SQLite
+        if not HAS_RETURNING:
+            self.db.cursor.execute(
+                self._read_sql(
+                    table,
+                    ('*',),
+                    tuple((key, False) for key in parameters),
+                    None,
+                    False,
+                    False
+                ),
+                list(parameters.values()),
+            )
+
+        # Fetch every row, so the statement is finished before commit
+        rows = self.db.cursor.fetchall()
+        return rows[0] if rows else None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+    def _delete_sql(
+        table: str,
+        where: Tuple[str, ...]
+    ) -> str:
+        """
+        Build a DELETE query. Results are cached by query shape.
+
+        Args:
+            table (str): The table to delete from.
+            where (Tuple[str, ...]): Columns identifying the record.
+
+        Returns:
+            str: The SQL query
+        """
+
+        DatabaseManager._check_identifiers((table, *where))
+
+        return (
+            f"DELETE FROM {table} "
+            f"WHERE {' AND '.join(f'{key} = ?' for key in where)}"
+        )
+
     def delete(
         self,
         table: str,
@@ -357,18 +1132,19 @@ class DatabaseManager:
             None
         """
 
-        param_list = []
-
-        delete_string = f"DELETE FROM {table} WHERE "
+        param_list = list(parameters.values())
 
-        for key, value in parameters.items():
-            delete_string += f"{key} = ? AND "
-            param_list.append(value)
-        delete_string = delete_string.rstrip(" AND ")
+        delete_string = self._delete_sql(
+            table,
+            tuple(parameters)
+        )
 
         logging.debug(
-            f"Delete query: {delete_string} with params: {param_list}"
+            "Delete query: %s with params: %s",
+            delete_string,
+            param_list
         )
+        self.db.begin_write()
         result = self.db.cursor.execute(
             delete_string,
             param_list,
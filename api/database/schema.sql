@@ -9,12 +9,16 @@ Tables:
     - annotations: Annotations on layers
 
 Indexes:
-    - idx_map_areas_project: Index on project_id in map_areas
+    - idx_map_areas_project_created: project_id, created_at in map_areas
+    - idx_map_areas_project_parent:
+        project_id, parent_id, created_at in map_areas
     - idx_map_areas_parent: Index on parent_id in map_areas
     - idx_boundaries_map_area: Index on map_area_id in boundaries
     - idx_layers_map_area: Index on map_area_id in layers
     - idx_layers_parent: Index on parent_layer_id in layers
-    - idx_annotations_layer: Index on layer_id in annotations
+    - idx_layers_area_parent_z:
+        map_area_id, parent_layer_id, z_index, created_at in layers
+    - idx_annotations_layer_created: layer_id, created_at in annotations
 */
 
 -- Project Table
@@ -89,9 +93,26 @@ CREATE TABLE IF NOT EXISTS annotations (
 );
 
 -- Indexes
-CREATE INDEX IF NOT EXISTS idx_map_areas_project ON map_areas(project_id);
+-- Maps are listed per project, or per project and parent, oldest first
+--   These return them in order from the index, with no sort step.
+--   Both cover lookups on project_id alone, so the older index is dropped
+DROP INDEX IF EXISTS idx_map_areas_project;
+CREATE INDEX IF NOT EXISTS idx_map_areas_project_created
+    ON map_areas(project_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_map_areas_project_parent
+    ON map_areas(project_id, parent_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_map_areas_parent ON map_areas(parent_id);
 CREATE INDEX IF NOT EXISTS idx_boundaries_map_area ON boundaries(map_area_id);
 CREATE INDEX IF NOT EXISTS idx_layers_map_area ON layers(map_area_id);
 CREATE INDEX IF NOT EXISTS idx_layers_parent ON layers(parent_layer_id);
-CREATE INDEX IF NOT EXISTS idx_annotations_layer ON annotations(layer_id);
+-- A map's own layers are listed by z_index, then created_at. This index
+--   finds them (parent_layer_id IS NULL) already in that order, so there
+--   is no sort step. idx_layers_map_area is kept for reads ordered by id
+CREATE INDEX IF NOT EXISTS idx_layers_area_parent_z
+    ON layers(map_area_id, parent_layer_id, z_index, created_at);
+-- Annotations are listed per layer, oldest first. Including created_at
+--   returns them in order from the index, with no sort step. It also
+--   covers lookups on layer_id alone, so the older index is dropped
+DROP INDEX IF EXISTS idx_annotations_layer;
+CREATE INDEX IF NOT EXISTS idx_annotations_layer_created
+    ON annotations(layer_id, created_at);
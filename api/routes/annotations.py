@@ -5,10 +5,16 @@ API endpoints for managing annotations.
 
 Blueprint: annotations_bp
 
+Handlers return plain dicts with a status code. Flask serializes them
+with the app's JSON provider (orjson), without a jsonify() step.
+
 Routes:
     list_annotations
         List annotations for a layer
         /api/annotations [GET]
+    list_annotations_stream
+        Stream annotations for a layer
+        /api/annotations/stream [GET]
     create_annotation
         Create a new annotation
         /api/annotations [POST]
@@ -26,9 +32,11 @@ Third Party Imports
     flask:
         Blueprint - Blueprint for route grouping
         Response - Response object for HTTP responses
+        current_app - Access the app's JSON provider
         request - Request object for accessing request data
-        jsonify - Function to create JSON responses
-        make_response - Function to create custom HTTP responses
+        stream_with_context - Keep the request context while streaming
+    flask.typing:
+        ResponseReturnValue - Anything a view can return
 
 Local Imports
     backend:
@@ -37,14 +45,18 @@ Local Imports
 """
 
 
+# Standard Library Imports
+from typing import Iterator
+
 # Third Party Imports
 from flask import (
     Blueprint,
     Response,
+    current_app,
     request,
-    jsonify,
-    make_response
+    stream_with_context
 )
+from flask.typing import ResponseReturnValue
 
 # Local Imports
 from backend import (
@@ -58,6 +70,16 @@ from backend.constants import (
     MAX_COLOR_STRING_LENGTH,
     MAX_DASH_ARRAY_LENGTH,
 )
+from backend.validation import first_missing_field
+
+
+# Fields a new annotation must have
+#   The tuple sets the order errors are reported in
+CREATE_REQUIRED_FIELDS = (
+    'layer_id',
+    'annotation_type',
+    'coordinates'
+)
 
 
 def validate_style(
@@ -183,7 +205,7 @@ annotations_bp = Blueprint(
     '',
     methods=['GET']
 )
-def list_annotations() -> Response:
+def list_annotations() -> ResponseReturnValue:
     """
     List annotations for a layer.
 
@@ -191,7 +213,7 @@ def list_annotations() -> Response:
         layer_id (int): Layer ID (query parameter)
 
     Returns:
-        Response: JSON response with annotation list
+        ResponseReturnValue: JSON response with annotation list
     """
 
     try:
@@ -200,42 +222,109 @@ def list_annotations() -> Response:
         # Get layer_id from query parameters
         layer_id = request.args.get('layer_id', type=int)
         if not layer_id:
-            return make_response(
-                jsonify(
-                    {'error': 'layer_id parameter required'}
-                ),
+            return (
+                {'error': 'layer_id parameter required'},
                 400
             )
 
         annotations = annotation_service.read(layer_id=layer_id)
-        return make_response(
-            jsonify(
-                {
-                    'annotations': [ann.to_dict() for ann in annotations]
-                }
-            ),
+        return (
+            {
+                'annotations': [
+                    ann.to_dict(iso_dates=False)
+                    for ann in annotations
+                ]
+            },
             200
         )
 
     except Exception as e:
-        return make_response(
-            jsonify(
-                {'error': str(e)}
-            ),
+        return (
+            {'error': str(e)},
             500
         )
 
 
+@annotations_bp.route(
+    '/stream',
+    methods=['GET']
+)
+def list_annotations_stream() -> ResponseReturnValue:
+    """
+    Stream annotations for a layer.
+        Returns the same body as list_annotations, but it's written
+        one annotation at a time, as rows are read from the database.
+        Memory use stays flat, no matter how large the layer is.
+
+    Args:
+        layer_id (int): Layer ID (query parameter)
+
+    Returns:
+        ResponseReturnValue: Streamed JSON response with annotation list
+    """
+
+    # Get layer_id from query parameters
+    layer_id = request.args.get('layer_id', type=int)
+    if not layer_id:
+        return (
+            {'error': 'layer_id parameter required'},
+            400
+        )
+
+    # Open the read and fetch the first annotation before any headers
+    #   go out, so a database error can still return a 500
+    try:
+        annotation_service = AnnotationService()
+        annotations = annotation_service.iter_annotations(layer_id)
+        first = next(annotations, None)
+
+    except Exception as e:
+        return (
+            {'error': str(e)},
+            500
+        )
+
+    def generate() -> Iterator[str]:
+        """
+        Write the JSON body in pieces.
+
+        Returns:
+            Iterator[str]: Chunks of the response body
+        """
+
+        dumps = current_app.json.dumps
+
+        try:
+            yield '{"annotations":['
+            if first is not None:
+                yield dumps(first.to_dict(iso_dates=False))
+                for annotation in annotations:
+                    yield ',' + dumps(annotation.to_dict(iso_dates=False))
+            yield ']}'
+
+        # Hand the connection back if the client stops reading early
+        finally:
+            annotations.close()
+
+    # Headers are sent before the body, so errors past this point
+    #   can't change the status code
+    return Response(
+        stream_with_context(generate()),
+        status=200,
+        mimetype='application/json'
+    )
+
+
 @annotations_bp.route(
     '',
     methods=['POST']
 )
-def create_annotation() -> Response:
+def create_annotation() -> ResponseReturnValue:
     """
     Create a new annotation.
 
     Returns:
-        Response: JSON response with created annotation
+        ResponseReturnValue: JSON response with created annotation
     """
 
     try:
@@ -244,27 +333,18 @@ def create_annotation() -> Response:
         # Get JSON data from request
         data = request.get_json()
         if not data:
-            return make_response(
-                jsonify(
-                    {'error': 'No data provided'}
-                ),
+            return (
+                {'error': 'No data provided'},
                 400
             )
 
         # Validate required fields
-        required_fields = [
-            'layer_id',
-            'annotation_type',
-            'coordinates'
-        ]
-        for field in required_fields:
-            if field not in data:
-                return make_response(
-                    jsonify(
-                        {'error': f'Missing required field: {field}'}
-                    ),
-                    400
-                )
+        missing = first_missing_field(data, CREATE_REQUIRED_FIELDS)
+        if missing:
+            return (
+                {'error': f'Missing required field: {missing}'},
+                400
+            )
 
         # Validate and sanitize style field
         style = {}
@@ -272,10 +352,8 @@ def create_annotation() -> Response:
             try:
                 style = validate_style(data['style'])
             except ValueError as ve:
-                return make_response(
-                    jsonify(
-                        {'error': f'Invalid style: {str(ve)}'}
-                    ),
+                return (
+                    {'error': f'Invalid style: {str(ve)}'},
                     400
                 )
 
@@ -292,26 +370,20 @@ def create_annotation() -> Response:
         created_annotation = annotation_service.create(
             annotation
         )
-        return make_response(
-            jsonify(
-                created_annotation.to_dict()
-            ),
+        return (
+            created_annotation.to_dict(iso_dates=False),
             201
         )
 
     except ValueError as e:
-        return make_response(
-            jsonify(
-                {'error': str(e)}
-            ),
+        return (
+            {'error': str(e)},
             400
         )
 
     except Exception as e:
-        return make_response(
-            jsonify(
-                {'error': str(e)}
-            ),
+        return (
+            {'error': str(e)},
             500
         )
 
@@ -322,7 +394,7 @@ def create_annotation() -> Response:
 )
 def get_annotation(
     annotation_id: int
-) -> Response:
+) -> ResponseReturnValue:
     """
     Get an annotation by ID.
 
@@ -330,7 +402,7 @@ def get_annotation(
         annotation_id (int): Annotation ID
 
     Returns:
-        Response: JSON response with annotation details
+        ResponseReturnValue: JSON response with annotation details
     """
 
     try:
@@ -339,25 +411,19 @@ def get_annotation(
         # Read annotation
         annotation = annotation_service.read(annotation_id=annotation_id)
         if not annotation:
-            return make_response(
-                jsonify(
-                    {'error': 'Annotation not found'}
-                ),
+            return (
+                {'error': 'Annotation not found'},
                 404
             )
 
-        return make_response(
-            jsonify(
-                annotation.to_dict()
-            ),
+        return (
+            annotation.to_dict(iso_dates=False),
             200
         )
 
     except Exception as e:
-        return make_response(
-            jsonify(
-                {'error': str(e)}
-            ),
+        return (
+            {'error': str(e)},
             500
         )
 
@@ -368,7 +434,7 @@ def get_annotation(
 )
 def update_annotation(
     annotation_id: int
-) -> Response:
+) -> ResponseReturnValue:
     """
     Update an annotation.
 
@@ -376,7 +442,7 @@ def update_annotation(
         annotation_id (int): Annotation ID
 
     Returns:
-        Response: JSON response with updated annotation
+        ResponseReturnValue: JSON response with updated annotation
     """
 
     try:
@@ -385,10 +451,8 @@ def update_annotation(
         # Get JSON data from request
         data = request.get_json()
         if not data:
-            return make_response(
-                jsonify(
-                    {'error': 'No data provided'}
-                ),
+            return (
+                {'error': 'No data provided'},
                 400
             )
 
@@ -397,10 +461,8 @@ def update_annotation(
             try:
                 data['style'] = validate_style(data['style'])
             except ValueError as ve:
-                return make_response(
-                    jsonify(
-                        {'error': f'Invalid style: {str(ve)}'}
-                    ),
+                return (
+                    {'error': f'Invalid style: {str(ve)}'},
                     400
                 )
 
@@ -412,26 +474,20 @@ def update_annotation(
 
         # Verify update success
         if not updated_annotation:
-            return make_response(
-                jsonify(
-                    {'error': 'Annotation not found'}
-                ),
+            return (
+                {'error': 'Annotation not found'},
                 404
             )
 
         # Return updated annotation
-        return make_response(
-            jsonify(
-                updated_annotation.to_dict()
-            ),
+        return (
+            updated_annotation.to_dict(iso_dates=False),
             200
         )
 
     except Exception as e:
-        return make_response(
-            jsonify(
-                {'error': str(e)}
-            ),
+        return (
+            {'error': str(e)},
             500
         )
 
@@ -442,7 +498,7 @@ def update_annotation(
 )
 def delete_annotation(
     annotation_id: int
-) -> Response:
+) -> ResponseReturnValue:
     """
     Delete an annotation.
 
@@ -450,7 +506,7 @@ def delete_annotation(
         annotation_id (int): Annotation ID
 
     Returns:
-        Response: JSON response confirming deletion
+        ResponseReturnValue: JSON response confirming deletion
     """
 
     try:
@@ -460,25 +516,19 @@ def delete_annotation(
 
         # Verify deletion success
         if not success:
-            return make_response(
-                jsonify(
-                    {'error': 'Annotation not found'}
-                ),
+            return (
+                {'error': 'Annotation not found'},
                 404
             )
 
         # Return success message
-        return make_response(
-            jsonify(
-                {'message': 'Annotation deleted successfully'}
-            ),
+        return (
+            {'message': 'Annotation deleted successfully'},
             200
         )
 
     except Exception as e:
-        return make_response(
-            jsonify(
-                {'error': str(e)}
-            ),
+        return (
+            {'error': str(e)},
             500
         )
@@ -35,6 +35,9 @@ Local Imports
 """
 
 
+# Standard Library Imports
+from typing import Any
+
 # Third Party Imports
 from flask import (
     Blueprint,
@@ -52,7 +55,41 @@ from backend import (
     LayerModel,
     LayerService
 )
-from backend.constants import DEFAULT_BOUNDARY_LAYER_COLOR
+from backend.constants import (
+    BOUNDARY_MAX_COORDINATES,
+    DEFAULT_BOUNDARY_LAYER_COLOR,
+)
+from backend.http_cache import conditional
+from backend.validation import first_missing_field
+
+
+# Fields a new boundary must have
+#   The tuple sets the order errors are reported in
+CREATE_REQUIRED_FIELDS = (
+    'map_area_id',
+    'coordinates'
+)
+
+
+def _too_many_coordinates(
+    coordinates: Any
+) -> bool:
+    """
+    Check if a boundary has more points than the API accepts.
+        Run before any containment check, so an oversized polygon
+        costs one len() call, not vertices x parent edges.
+
+    Args:
+        coordinates (Any): Coordinates from the request body
+
+    Returns:
+        bool: True if there are too many coordinate pairs
+    """
+
+    return (
+        isinstance(coordinates, list)
+        and len(coordinates) > BOUNDARY_MAX_COORDINATES
+    )
 
 
 # Blueprint
@@ -94,18 +131,28 @@ def create_boundary() -> Response:
             )
 
         # Validate required fields
-        required_fields = [
-            'map_area_id',
-            'coordinates'
-        ]
-        for field in required_fields:
-            if field not in data:
-                return make_response(
-                    jsonify(
-                        {'error': f'Missing required field: {field}'}
-                    ),
-                    400
-                )
+        missing = first_missing_field(data, CREATE_REQUIRED_FIELDS)
+        if missing:
+            return make_response(
+                jsonify(
+                    {'error': f'Missing required field: {missing}'}
+                ),
+                400
+            )
+
+        # Reject oversized polygons before any work is done on them
+        if _too_many_coordinates(data['coordinates']):
+            return make_response(
+                jsonify(
+                    {
+                        'error': (
+                            f'Boundary has too many coordinates '
+                            f'(max {BOUNDARY_MAX_COORDINATES})'
+                        )
+                    }
+                ),
+                413
+            )
 
         # Get the map area to check if it has a parent
         map_area = map_service.read(map_id=data['map_area_id'])
@@ -129,7 +176,7 @@ def create_boundary() -> Response:
                 # Check if coordinates are within parent boundary
                 is_valid = boundary_service.is_within_boundary(
                     coordinates=data['coordinates'],
-                    parent_boundary=parent_boundary.coordinates
+                    parent_boundary=parent_boundary
                 )
 
                 # If not valid, return error
@@ -196,7 +243,7 @@ def create_boundary() -> Response:
         # Return created boundary
         return make_response(
             jsonify(
-                created_boundary.to_dict()
+                created_boundary.to_dict(iso_dates=False)
             ),
             201
         )
@@ -243,6 +290,20 @@ def update_boundary(
                 400
             )
 
+        # Reject oversized polygons before any work is done on them
+        if _too_many_coordinates(data['coordinates']):
+            return make_response(
+                jsonify(
+                    {
+                        'error': (
+                            f'Boundary has too many coordinates '
+                            f'(max {BOUNDARY_MAX_COORDINATES})'
+                        )
+                    }
+                ),
+                413
+            )
+
         # Update boundary
         updated_boundary = boundary_service.update(
             boundary_id,
@@ -261,7 +322,7 @@ def update_boundary(
         # Return updated boundary
         return make_response(
             jsonify(
-                updated_boundary.to_dict()
+                updated_boundary.to_dict(iso_dates=False)
             ),
             200
         )
@@ -355,11 +416,13 @@ def get_boundary_by_map_area(
             )
 
         # Return boundary
-        return make_response(
-            jsonify(
-                boundary.to_dict()
-            ),
-            200
+        return conditional(
+            make_response(
+                jsonify(
+                    boundary.to_dict(iso_dates=False)
+                ),
+                200
+            )
         )
 
     except Exception as e:
@@ -17,6 +17,7 @@ Third Party Imports
     flask:
         Blueprint - Blueprint for route grouping
         Response - Response object for HTTP responses
+        current_app - Access the application configuration
         request - Request object for accessing request data
         jsonify - Function to create JSON responses
         send_file - Function to send files as responses
@@ -27,18 +28,23 @@ Local Imports
         ExportService - Service layer for export operations
     backend.config:
         Config - Configuration settings
+    backend.constants:
+        EXPORT_DOWNLOAD_MAX_AGE - Browser cache time for export files
 """
 
 
 # Standard Library Imports
 import io
 import logging
+import time
 from typing import Any
+from urllib.parse import quote
 
 # Third Party Imports
 from flask import (
     Blueprint,
     Response,
+    current_app,
     request,
     jsonify,
     send_file,
@@ -48,6 +54,7 @@ from flask import (
 # Local Imports
 from backend import ExportService
 from backend.config import Config
+from backend.constants import EXPORT_DOWNLOAD_MAX_AGE
 
 
 # Blueprint
@@ -156,6 +163,10 @@ def download_export(
 ) -> Any:
     """
     Download an exported map file.
+        Behind nginx (EXPORT_ACCEL_PREFIX set), the proxy sends the file
+        with sendfile(2), and the worker only writes headers.
+        Otherwise Flask sends it, which gunicorn also streams with
+        sendfile(2) through wsgi.file_wrapper.
 
     Args:
         filename (str): Export filename
@@ -173,11 +184,30 @@ def download_export(
                 404
             )
 
+        accel_prefix = current_app.config.get('EXPORT_ACCEL_PREFIX')
+        if accel_prefix:
+            response = Response(mimetype='image/png')
+            response.headers['X-Accel-Redirect'] = (
+                accel_prefix.rstrip('/') + '/' + quote(filename)
+            )
+            response.headers.set(
+                'Content-Disposition',
+                'attachment',
+                filename=filename
+            )
+
+            # The same caching send_file applies below
+            response.cache_control.public = True
+            response.cache_control.max_age = EXPORT_DOWNLOAD_MAX_AGE
+            response.expires = int(time.time() + EXPORT_DOWNLOAD_MAX_AGE)
+            return response
+
         return send_file(
             filepath,
             mimetype='image/png',
             as_attachment=True,
-            download_name=filename
+            download_name=filename,
+            max_age=EXPORT_DOWNLOAD_MAX_AGE
         )
 
     except Exception as e:
@@ -62,6 +62,17 @@ from backend.constants import (
     LAYER_MIN_LINE_THICKNESS,
     LAYER_MAX_LINE_THICKNESS,
 )
+from backend.http_cache import conditional
+from backend.validation import first_missing_field
+
+
+# Fields a new layer must have
+#   The tuple sets the order errors are reported in
+CREATE_REQUIRED_FIELDS = (
+    'map_area_id',
+    'name',
+    'layer_type'
+)
 
 
 # Blueprint
@@ -101,7 +112,10 @@ def list_layers() -> Union[Response, Tuple[Response, int]]:
         return make_response(
             jsonify(
                 {
-                    'layers': [layer.to_dict() for layer in layers]
+                    'layers': [
+                        layer.to_dict(iso_dates=False)
+                        for layer in layers
+                    ]
                 }
             ), 200
         )
@@ -161,19 +175,14 @@ def create_layer() -> Union[Response, Tuple[Response, int]]:
             )
 
         # Validate required fields
-        required_fields = [
-            'map_area_id',
-            'name',
-            'layer_type'
-        ]
-        for field in required_fields:
-            if field not in data:
-                return make_response(
-                    jsonify(
-                        {'error': f'Missing required field: {field}'}
-                    ),
-                    400
-                )
+        missing = first_missing_field(data, CREATE_REQUIRED_FIELDS)
+        if missing:
+            return make_response(
+                jsonify(
+                    {'error': f'Missing required field: {missing}'}
+                ),
+                400
+            )
 
         # Validate and sanitize config field
         config = {}
@@ -215,7 +224,7 @@ def create_layer() -> Union[Response, Tuple[Response, int]]:
         created_layer = layer_service.create(layer=layer)
         return make_response(
             jsonify(
-                created_layer.to_dict()
+                created_layer.to_dict(iso_dates=False)
             ),
             201
         )
@@ -269,11 +278,13 @@ def get_layer(
             )
 
         # Return layer details
-        return make_response(
-            jsonify(
-                layer.to_dict()
-            ),
-            200
+        return conditional(
+            make_response(
+                jsonify(
+                    layer.to_dict(iso_dates=False)
+                ),
+                200
+            )
         )
 
     except Exception as e:
@@ -391,7 +402,7 @@ def update_layer(
         # Return updated layer details
         return make_response(
             jsonify(
-                updated_layer.to_dict()
+                updated_layer.to_dict(iso_dates=False)
             ),
             200
         )
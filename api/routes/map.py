@@ -51,6 +51,28 @@ from backend import (
     MapModel,
     MapService
 )
+from backend.http_cache import conditional
+from backend.validation import (
+    first_missing_field,
+    first_non_numeric_field
+)
+
+
+# Fields a new map area must have
+#   The tuple sets the order errors are reported in
+CREATE_REQUIRED_FIELDS = (
+    'project_id',
+    'name',
+    'area_type'
+)
+
+# Fields that must be numbers when a map area is updated
+#   Checked before writing, so a bad value is never stored
+UPDATE_NUMERIC_FIELDS = (
+    'default_center_lat',
+    'default_center_lon',
+    'default_zoom'
+)
 
 
 # Blueprint
@@ -111,7 +133,7 @@ def list_map_areas() -> Response:
         return make_response(
             jsonify(
                 {
-                    'map_areas': [ma.to_dict() for ma in maps]
+                    'map_areas': [ma.to_dict(iso_dates=False) for ma in maps]
                 }
             ),
             200
@@ -155,21 +177,14 @@ def create_map_area() -> Response:
             )
 
         # Check for required fields
-        required_fields = [
-            'project_id',
-            'name',
-            'area_type'
-        ]
-
-        # Validate required fields
-        for field in required_fields:
-            if field not in data:
-                return make_response(
-                    jsonify(
-                        {'error': f'Missing required field: {field}'}
-                    ),
-                    400
-                )
+        missing = first_missing_field(data, CREATE_REQUIRED_FIELDS)
+        if missing:
+            return make_response(
+                jsonify(
+                    {'error': f'Missing required field: {missing}'}
+                ),
+                400
+            )
 
         # Create MapModel instance
         map_area = MapModel(
@@ -186,7 +201,7 @@ def create_map_area() -> Response:
         created_map = map_area_service.create(map_area)
         return make_response(
             jsonify(
-                created_map.to_dict()
+                created_map.to_dict(iso_dates=False)
             ),
             201
         )
@@ -242,11 +257,13 @@ def get_map_area(
             )
 
         # Return the map area details
-        return make_response(
-            jsonify(
-                map_area.to_dict()
-            ),
-            200
+        return conditional(
+            make_response(
+                jsonify(
+                    map_area.to_dict(iso_dates=False)
+                ),
+                200
+            )
         )
 
     except Exception as e:
@@ -298,6 +315,16 @@ def update_map_area(
                 400
             )
 
+        # Coordinates and zoom must be numbers
+        invalid = first_non_numeric_field(data, UPDATE_NUMERIC_FIELDS)
+        if invalid:
+            return make_response(
+                jsonify(
+                    {'error': f'{invalid} must be a number'}
+                ),
+                400
+            )
+
         # Update the map
         updated_map_area = map_area_service.update(
             map_area_id,
@@ -316,7 +343,7 @@ def update_map_area(
         # Return updated map area
         return make_response(
             jsonify(
-                updated_map_area.to_dict()
+                updated_map_area.to_dict(iso_dates=False)
             ),
             200
         )
@@ -56,11 +56,32 @@ from backend import (
     ProjectService
 )
 from backend.config import Config
+from backend.http_cache import conditional
+from backend.validation import (
+    first_missing_field,
+    first_non_numeric_field
+)
 
 
 # Logging
 logger = logging.getLogger(__name__)
 
+
+# Fields a new project must have
+#   The tuple sets the order errors are reported in
+CREATE_REQUIRED_FIELDS = (
+    'name',
+)
+
+# Fields that must be numbers when a project is updated
+#   Checked before writing, so a bad value is never stored
+UPDATE_NUMERIC_FIELDS = (
+    'center_lat',
+    'center_lon',
+    'zoom_level',
+)
+
+
 # Blueprint
 projects_bp = Blueprint(
     'projects',
@@ -94,7 +115,7 @@ def list_projects() -> Response:
         return make_response(
             jsonify(
                 {
-                    'projects': [p.to_dict() for p in projects]
+                    'projects': [p.to_dict(iso_dates=False) for p in projects]
                 }
             ),
             200
@@ -151,16 +172,15 @@ def create_project() -> Response:
             )
 
         # Check that mandatory fields are present
-        required_fields = ['name']
-        for field in required_fields:
-            if field not in data:
-                logger.warning(f"Missing required field: {field}")
-                return make_response(
-                    jsonify(
-                        {'error': f'Missing required field: {field}'}
-                    ),
-                    400
-                )
+        missing = first_missing_field(data, CREATE_REQUIRED_FIELDS)
+        if missing:
+            logger.warning(f"Missing required field: {missing}")
+            return make_response(
+                jsonify(
+                    {'error': f'Missing required field: {missing}'}
+                ),
+                400
+            )
 
         # Build into a ProjectModel data structure
         # Use Config defaults if values not provided
@@ -183,7 +203,7 @@ def create_project() -> Response:
         logger.debug(f"Created project: {created_project.to_dict()}")
         return make_response(
             jsonify(
-                created_project.to_dict()
+                created_project.to_dict(iso_dates=False)
             ),
             201
         )
@@ -243,11 +263,13 @@ def get_project(
 
         # Return the project details as JSON
         logger.debug(f"Fetched project {project_id}: {project.to_dict()}")
-        return make_response(
-            jsonify(
-                project.to_dict()
-            ),
-            200
+        return conditional(
+            make_response(
+                jsonify(
+                    project.to_dict(iso_dates=False)
+                ),
+                200
+            )
         )
 
     except Exception as e:
@@ -298,6 +320,16 @@ def update_project(
                 400
             )
 
+        # Coordinates and zoom must be numbers
+        invalid = first_non_numeric_field(data, UPDATE_NUMERIC_FIELDS)
+        if invalid:
+            return make_response(
+                jsonify(
+                    {'error': f'{invalid} must be a number'}
+                ),
+                400
+            )
+
         # Update the project via the service
         updated_project = project_service.update(
             project_id,
@@ -316,7 +348,7 @@ def update_project(
         # If successful, return the updated project details
         return make_response(
             jsonify(
-                updated_project.to_dict()
+                updated_project.to_dict(iso_dates=False)
             ),
             200
         )
@@ -497,7 +529,7 @@ def import_project() -> Response:
             jsonify(
                 {
                     'message': 'Project imported successfully',
-                    'project': new_project.to_dict()
+                    'project': new_project.to_dict(iso_dates=False)
                 }
             ),
             201
@@ -8,14 +8,16 @@ Fixtures for testing.
 
 # Standard library imports
 from pathlib import Path
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Iterator
 import pytest
 from flask import Flask, jsonify
 
 # Local imports
 from backend.config import Config
 from backend.export import ExportService
+from backend.json_provider import OrjsonProvider
 from database import (
+    ConnectionPool,
     DatabaseContext,
     DatabaseManager
 )
@@ -87,20 +89,17 @@ def invalid_project_id() -> int:
 @pytest.fixture
 def app(
     tmp_path: Path
-) -> Flask:
+) -> Iterator[Flask]:
     db_path = tmp_path / "test.db"
     export_path = tmp_path / "exports"
     export_path.mkdir(parents=True, exist_ok=True)
 
-    schema_path = (
-        Path(__file__).resolve().parents[1] / "database" / "schema.sql"
-    )
-
     with DatabaseContext(str(db_path)) as db_ctx:
         db_manager = DatabaseManager(db_ctx)
-        db_manager.initialise(schema_file=str(schema_path))
+        db_manager.initialise()
 
     test_app = Flask(__name__)
+    test_app.json = OrjsonProvider(test_app)
     test_app.config.update(
         TESTING=True,
         SECRET_KEY="test-secret-key",
@@ -155,7 +154,10 @@ def app(
             }
         )
 
-    return test_app
+    yield test_app
+
+    # Pooled connections would otherwise outlive the temporary database
+    ConnectionPool.close_all()
 
 
 @pytest.fixture
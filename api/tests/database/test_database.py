@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from database import ConnectionPool, DatabaseContext, DatabaseManager
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "nested.db")
+    with DatabaseContext(path) as db_ctx:
+        DatabaseManager(db_ctx).initialise()
+
+    yield path
+
+    ConnectionPool.close_all()
+
+
+def _project(name):
+    return {
+        "name": name,
+        "description": "",
+        "center_lat": 0.0,
+        "center_lon": 0.0,
+    }
+
+
+def test_nested_write_context_fails_fast(db_path):
+    started = time.monotonic()
+
+    with DatabaseContext(db_path) as outer:
+        outer_manager = DatabaseManager(outer)
+        outer_manager.create(table="projects", params=_project("Outer"))
+
+        with pytest.raises(RuntimeError, match="Nested write contexts"):
+            with DatabaseContext(db_path) as inner:
+                DatabaseManager(inner).create(
+                    table="projects",
+                    params=_project("Inner"),
+                )
+
+        # Reads may still nest inside a write
+        with DatabaseContext(db_path, read_only=True) as reader:
+            DatabaseManager(reader).read(
+                table="projects",
+                fields=["id"],
+                get_all=True,
+            )
+
+    # Failed at once, rather than after the 5 second busy_timeout
+    assert time.monotonic() - started < 1
+
+    with DatabaseContext(db_path) as db_ctx:
+        rows = DatabaseManager(db_ctx).read(
+            table="projects",
+            fields=["name"],
+            get_all=True,
+        )
+
+    assert [row["name"] for row in rows] == ["Outer"]
+
+
+def test_write_contexts_in_sequence(db_path):
+    for name in ("First", "Second"):
+        with DatabaseContext(db_path) as db_ctx:
+            DatabaseManager(db_ctx).create(
+                table="projects",
+                params=_project(name),
+            )
+
+    with DatabaseContext(db_path, read_only=True) as db_ctx:
+        rows = DatabaseManager(db_ctx).read(
+            table="projects",
+            fields=["name"],
+            order_by=["id"],
+            get_all=True,
+        )
+
+    assert [row["name"] for row in rows] == ["First", "Second"]
@@ -1,3 +1,6 @@
+from backend.annotation import AnnotationService
+
+
 def test_list_annotations_requires_layer_id(client):
     response = client.get("/api/annotations")
 
@@ -46,3 +49,93 @@ def test_create_and_list_annotations(client, create_layer):
     assert created["layer_id"] == layer["id"]
     assert list_response.status_code == 200
     assert any(annotation["id"] == created["id"] for annotation in listed)
+
+
+def test_stream_annotations_matches_list(client, create_layer):
+    layer = create_layer(layer_type="annotation")
+
+    for lat in (-33.86, -33.87):
+        client.post(
+            "/api/annotations",
+            json={
+                "layer_id": layer["id"],
+                "annotation_type": "marker",
+                "coordinates": [lat, 151.21],
+            },
+        )
+
+    list_response = client.get(f"/api/annotations?layer_id={layer['id']}")
+    stream_response = client.get(
+        f"/api/annotations/stream?layer_id={layer['id']}"
+    )
+
+    assert stream_response.status_code == 200
+    assert stream_response.is_streamed
+    assert stream_response.get_json() == list_response.get_json()
+
+
+def test_stream_annotations_empty_layer(client, create_layer):
+    layer = create_layer(layer_type="annotation")
+
+    response = client.get(f"/api/annotations/stream?layer_id={layer['id']}")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"annotations": []}
+
+
+def test_stream_annotations_reports_read_errors(
+    client, create_layer, monkeypatch
+):
+    layer = create_layer(layer_type="annotation")
+
+    # Fails on the first row, like a database error would
+    def failing_iter(self, layer_id):
+        raise RuntimeError("database is locked")
+        yield
+
+    monkeypatch.setattr(AnnotationService, "iter_annotations", failing_iter)
+    response = client.get(f"/api/annotations/stream?layer_id={layer['id']}")
+
+    assert response.status_code == 500
+    assert response.get_json() == {"error": "database is locked"}
+
+
+def test_update_annotation_returns_new_values(client, create_layer):
+    layer = create_layer(layer_type="annotation")
+    created = client.post(
+        "/api/annotations",
+        json={
+            "layer_id": layer["id"],
+            "annotation_type": "marker",
+            "coordinates": [-33.86, 151.21],
+        },
+    ).get_json()
+
+    update_response = client.put(
+        f"/api/annotations/{created['id']}",
+        json={"coordinates": [-33.87, 151.22]},
+    )
+    missing_response = client.put(
+        "/api/annotations/9999",
+        json={"coordinates": [-33.87, 151.22]},
+    )
+
+    assert update_response.status_code == 200
+    assert update_response.get_json()["coordinates"] == [-33.87, 151.22]
+    assert missing_response.status_code == 404
+
+
+def test_create_annotation_on_missing_layer(client):
+    response = client.post(
+        "/api/annotations",
+        json={
+            "layer_id": 9999,
+            "annotation_type": "marker",
+            "coordinates": [-33.86, 151.21],
+        },
+    )
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == (
+        "Error validating layer: Layer with ID 9999 does not exist"
+    )
@@ -1,3 +1,6 @@
+import math
+
+
 def test_create_boundary_requires_coordinates(client):
     response = client.post(
         "/api/boundaries",
@@ -41,3 +44,123 @@ def test_create_and_get_boundary_for_map_area(client, create_map_area):
     assert created["map_area_id"] == map_area["id"]
     assert get_response.status_code == 200
     assert fetched["id"] == created["id"]
+
+
+def test_create_boundary_must_be_within_parent(client, create_map_area):
+    region = create_map_area()
+    client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": region["id"],
+            "coordinates": [
+                [-34.0, 151.0],
+                [-34.0, 151.4],
+                [-33.6, 151.4],
+                [-33.6, 151.0],
+            ],
+        },
+    )
+    suburb = create_map_area(
+        project_id=region["project_id"],
+        parent_id=region["id"],
+        name="Suburb 1",
+        area_type="suburb",
+    )
+
+    outside_response = client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": suburb["id"],
+            "coordinates": [
+                [-33.9, 151.1],
+                [-33.9, 151.5],
+                [-33.7, 151.1],
+            ],
+        },
+    )
+    inside_response = client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": suburb["id"],
+            "coordinates": [
+                [-33.9, 151.1],
+                [-33.9, 151.3],
+                [-33.7, 151.1],
+            ],
+        },
+    )
+
+    assert outside_response.status_code == 400
+    assert "within the region map" in outside_response.get_json()["error"]
+    assert inside_response.status_code == 201
+
+
+def test_create_boundary_rejects_too_many_coordinates(
+    client, create_map_area, monkeypatch
+):
+    monkeypatch.setattr(
+        "routes.boundaries.BOUNDARY_MAX_COORDINATES", 3
+    )
+    map_area = create_map_area()
+
+    response = client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": map_area["id"],
+            "coordinates": [[0.0, 0.0]] * 4,
+        },
+    )
+
+    assert response.status_code == 413
+    assert "too many coordinates" in response.get_json()["error"]
+
+
+def test_create_boundary_within_large_parent(client, create_map_area):
+    # Enough vertices that the parent's edges are split into bands
+    region = create_map_area()
+    client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": region["id"],
+            "coordinates": [
+                [
+                    -33.8 + 0.2 * math.cos(2 * math.pi * k / 400),
+                    151.2 + 0.2 * math.sin(2 * math.pi * k / 400),
+                ]
+                for k in range(400)
+            ],
+        },
+    )
+    suburb = create_map_area(
+        project_id=region["project_id"],
+        parent_id=region["id"],
+        name="Suburb 1",
+        area_type="suburb",
+    )
+
+    # Inside the bounding box, but past the circle's edge
+    corner_response = client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": suburb["id"],
+            "coordinates": [
+                [-33.8, 151.2],
+                [-33.65, 151.35],
+                [-33.8, 151.3],
+            ],
+        },
+    )
+    inside_response = client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": suburb["id"],
+            "coordinates": [
+                [-33.8, 151.2],
+                [-33.7, 151.3],
+                [-33.8, 151.3],
+            ],
+        },
+    )
+
+    assert corner_response.status_code == 400
+    assert inside_response.status_code == 201
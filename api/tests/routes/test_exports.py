@@ -51,3 +51,46 @@ def test_download_export_returns_404_when_file_missing(client, monkeypatch):
 
     assert response.status_code == 404
     assert response.get_json()["error"] == "File not found"
+
+
+def test_download_export_uses_accel_redirect_when_configured(
+    app, client, monkeypatch
+):
+    app.config["EXPORT_ACCEL_PREFIX"] = "/internal-exports/"
+    monkeypatch.setattr(
+        exports_routes.export_service,
+        "get_export_path",
+        lambda filename: f"/exports/{filename}",
+    )
+
+    response = client.get("/api/exports/endpoint-export.png")
+
+    assert response.status_code == 200
+    assert response.data == b""
+    assert (
+        response.headers["X-Accel-Redirect"]
+        == "/internal-exports/endpoint-export.png"
+    )
+    assert "endpoint-export.png" in response.headers["Content-Disposition"]
+
+
+def test_download_export_caches_the_same_with_and_without_accel(
+    app, client, monkeypatch, tmp_path
+):
+    export_file = tmp_path / "cached-export.png"
+    export_file.write_bytes(b"png")
+    monkeypatch.setattr(
+        exports_routes.export_service,
+        "get_export_path",
+        lambda filename: str(export_file),
+    )
+
+    sent = client.get("/api/exports/cached-export.png")
+    app.config["EXPORT_ACCEL_PREFIX"] = "/internal-exports/"
+    redirected = client.get("/api/exports/cached-export.png")
+
+    assert sent.status_code == 200
+    assert redirected.status_code == 200
+    assert "X-Accel-Redirect" in redirected.headers
+    assert sent.headers["Cache-Control"] == redirected.headers["Cache-Control"]
+    assert "Expires" in redirected.headers
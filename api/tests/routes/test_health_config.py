@@ -18,6 +18,9 @@ import requests
 BASE_URL = "http://localhost:5000"
 API_PREFIX = "/api"
 
+# One keep-alive connection for every request in this module
+SESSION = requests.Session()
+
 
 class TestHealthConfig:
     """
@@ -40,7 +43,7 @@ class TestHealthConfig:
         """
 
         # Send a GET request to the health endpoint
-        response = requests.get(f"{BASE_URL}/health")
+        response = SESSION.get(f"{BASE_URL}/health")
         assert response.status_code == 200
         data = response.json()
 
@@ -58,7 +61,7 @@ class TestHealthConfig:
         """
 
         # Send a GET request to the config endpoint
-        response = requests.get(f"{BASE_URL}{API_PREFIX}/config")
+        response = SESSION.get(f"{BASE_URL}{API_PREFIX}/config")
         assert response.status_code == 200
         data = response.json()
 
@@ -1,3 +1,7 @@
+from backend.layer import LayerService
+from database import DatabaseContext, DatabaseManager
+
+
 def test_list_layers_requires_map_area_id(client):
     response = client.get("/api/layers")
 
@@ -42,3 +46,172 @@ def test_create_and_list_layers(client, create_map_area):
     assert created["name"] == "Custom Layer"
     assert list_response.status_code == 200
     assert any(layer["id"] == created["id"] for layer in listed)
+
+
+def test_child_map_inherits_parent_layers_once(client, create_map_area):
+    region = create_map_area()
+    parent_layer = client.post(
+        "/api/layers",
+        json={
+            "map_area_id": region["id"],
+            "name": "Roads",
+            "layer_type": "custom",
+        },
+    ).get_json()
+    suburb = create_map_area(
+        project_id=region["project_id"],
+        parent_id=region["id"],
+        name="Suburb 1",
+        area_type="suburb",
+    )
+
+    first = client.get(f"/api/layers?map_area_id={suburb['id']}")
+    second = client.get(f"/api/layers?map_area_id={suburb['id']}")
+    inherited = [
+        layer for layer in first.get_json()["layers"]
+        if layer["parent_layer_id"] == parent_layer["id"]
+    ]
+
+    assert first.status_code == 200
+    assert len(inherited) == 1
+    assert inherited[0]["name"] == "Region Roads"
+    assert inherited[0]["is_editable"] is False
+    assert [layer["id"] for layer in second.get_json()["layers"]] == [
+        layer["id"] for layer in first.get_json()["layers"]
+    ]
+
+
+def test_inherited_layer_edit_rules(client, create_map_area):
+    region = create_map_area()
+    parent_layer = client.post(
+        "/api/layers",
+        json={
+            "map_area_id": region["id"],
+            "name": "Roads",
+            "layer_type": "custom",
+        },
+    ).get_json()
+    suburb = create_map_area(
+        project_id=region["project_id"],
+        parent_id=region["id"],
+        name="Suburb 1",
+        area_type="suburb",
+    )
+    inherited = next(
+        layer
+        for layer in client.get(
+            f"/api/layers?map_area_id={suburb['id']}"
+        ).get_json()["layers"]
+        if layer["parent_layer_id"] == parent_layer["id"]
+    )
+
+    hide_response = client.put(
+        f"/api/layers/{inherited['id']}",
+        json={"visible": False},
+    )
+    rename_response = client.put(
+        f"/api/layers/{inherited['id']}",
+        json={"name": "Renamed"},
+    )
+    delete_inherited = client.delete(f"/api/layers/{inherited['id']}")
+    delete_own = client.delete(f"/api/layers/{parent_layer['id']}")
+    delete_missing = client.delete("/api/layers/9999")
+
+    assert hide_response.status_code == 200
+    assert hide_response.get_json()["visible"] is False
+    assert rename_response.get_json()["error"] == (
+        "Inherited layers can only update visibility."
+    )
+    assert "Cannot delete inherited layer" in (
+        delete_inherited.get_json()["error"]
+    )
+    assert delete_own.status_code == 200
+    assert delete_missing.status_code == 404
+
+
+def test_reorder_layers_updates_z_index(app, client, create_map_area):
+    map_area = create_map_area()
+    layers = [
+        client.post(
+            "/api/layers",
+            json={
+                "map_area_id": map_area["id"],
+                "name": name,
+                "layer_type": "annotation",
+                "z_index": z_index,
+            },
+        ).get_json()
+        for z_index, name in enumerate(("Bottom", "Middle", "Top"))
+    ]
+    bottom, middle, top = layers
+
+    updates = [
+        {"id": top["id"], "z_index": 0},
+        {"id": bottom["id"], "z_index": 1},
+        {"id": middle["id"], "z_index": 2},
+        {"id": 999999, "z_index": 3},
+    ]
+    with app.app_context():
+        reordered = LayerService()._reorder_layers(updates)
+
+    listed = client.get(
+        f"/api/layers?map_area_id={map_area['id']}"
+    ).get_json()["layers"]
+
+    # Returned in the order given, skipping the unknown layer
+    assert [layer.id for layer in reordered] == [
+        top["id"],
+        bottom["id"],
+        middle["id"],
+    ]
+    assert [layer.z_index for layer in reordered] == [0, 1, 2]
+    assert [layer.name for layer in reordered] == ["Top", "Bottom", "Middle"]
+    assert [layer["name"] for layer in listed] == ["Top", "Bottom", "Middle"]
+    assert [layer["z_index"] for layer in listed] == [0, 1, 2]
+
+
+def test_failed_inherited_rename_keeps_stored_name(
+    app, client, create_map_area, monkeypatch
+):
+    region = create_map_area()
+    client.post(
+        "/api/layers",
+        json={
+            "map_area_id": region["id"],
+            "name": "Roads",
+            "layer_type": "custom",
+        },
+    )
+    suburb = create_map_area(
+        project_id=region["project_id"],
+        parent_id=region["id"],
+        name="Suburb 1",
+        area_type="suburb",
+    )
+    inherited = client.get(
+        f"/api/layers?map_area_id={suburb['id']}"
+    ).get_json()["layers"][0]
+
+    # Give the copy an out of date name, then make the rename fail
+    with DatabaseContext(app.config["DATABASE_PATH"]) as db_ctx:
+        DatabaseManager(db_ctx).update(
+            table="layers",
+            fields={"name": "Old Name"},
+            parameters={"id": inherited["id"]},
+        )
+
+    def failing_update(self, *args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(DatabaseManager, "update", failing_update)
+    listed = client.get(
+        f"/api/layers?map_area_id={suburb['id']}"
+    ).get_json()["layers"]
+    monkeypatch.undo()
+    renamed = client.get(
+        f"/api/layers?map_area_id={suburb['id']}"
+    ).get_json()["layers"]
+
+    assert listed[0]["id"] == inherited["id"]
+    assert listed[0]["name"] == "Old Name"
+    assert renamed[0]["name"] == "Region Roads"
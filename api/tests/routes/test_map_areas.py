@@ -1,3 +1,6 @@
+from database import DatabaseContext, DatabaseManager
+
+
 def test_list_map_areas_requires_project_id(client):
     response = client.get("/api/map-areas")
 
@@ -35,3 +38,119 @@ def test_create_and_list_map_areas(client, create_project):
     assert created["name"] == "Sydney Region"
     assert list_response.status_code == 200
     assert any(area["id"] == created["id"] for area in listed)
+
+
+def test_get_map_area_revalidates_with_etag(client, create_project):
+    project = create_project(name="ETag Project")
+    created = client.post(
+        "/api/map-areas",
+        json={
+            "project_id": project["id"],
+            "name": "Cached Region",
+            "area_type": "region",
+        },
+    ).get_json()
+
+    first = client.get(f"/api/map-areas/{created['id']}")
+    etag = first.headers["ETag"]
+    cached = client.get(
+        f"/api/map-areas/{created['id']}",
+        headers={"If-None-Match": etag},
+    )
+
+    client.put(f"/api/map-areas/{created['id']}", json={"name": "Renamed"})
+    changed = client.get(
+        f"/api/map-areas/{created['id']}",
+        headers={"If-None-Match": etag},
+    )
+
+    assert first.status_code == 200
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert changed.status_code == 200
+    assert changed.get_json()["name"] == "Renamed"
+
+
+def test_update_map_area_returns_new_values(client, create_project):
+    project = create_project(name="Update Project")
+    created = client.post(
+        "/api/map-areas",
+        json={
+            "project_id": project["id"],
+            "name": "Before",
+            "area_type": "region",
+        },
+    ).get_json()
+
+    response = client.put(
+        f"/api/map-areas/{created['id']}",
+        json={"name": "After", "default_zoom": 12},
+    )
+    missing = client.put("/api/map-areas/999999", json={"name": "Nobody"})
+
+    assert response.status_code == 200
+    assert response.get_json()["name"] == "After"
+    assert response.get_json()["default_zoom"] == 12
+    assert response.get_json()["project_id"] == project["id"]
+    assert missing.status_code == 404
+
+
+def test_update_map_area_whole_number_center_matches_get(
+    client, create_project
+):
+    project = create_project(name="Whole Number Project")
+    created = client.post(
+        "/api/map-areas",
+        json={
+            "project_id": project["id"],
+            "name": "Centred",
+            "area_type": "region",
+        },
+    ).get_json()
+
+    updated = client.put(
+        f"/api/map-areas/{created['id']}",
+        json={"default_center_lat": -33, "default_center_lon": 151},
+    ).get_json()
+    fetched = client.get(f"/api/map-areas/{created['id']}").get_json()
+
+    assert updated["default_center_lat"] == fetched["default_center_lat"]
+    assert updated["default_center_lon"] == fetched["default_center_lon"]
+    assert isinstance(updated["default_center_lat"], float)
+    assert isinstance(updated["default_center_lon"], float)
+
+
+def test_non_numeric_center_cannot_break_reads(app, client, create_project):
+    project = create_project(name="Bad Centre Project")
+    created = client.post(
+        "/api/map-areas",
+        json={
+            "project_id": project["id"],
+            "name": "Bad Centre",
+            "area_type": "region",
+        },
+    ).get_json()
+
+    rejected = client.put(
+        f"/api/map-areas/{created['id']}",
+        json={"default_center_lat": "abc"},
+    )
+
+    # A bad value stored before updates were checked still reads back
+    with DatabaseContext(app.config["DATABASE_PATH"]) as db_ctx:
+        DatabaseManager(db_ctx).update(
+            table="map_areas",
+            fields={"default_center_lon": "abc"},
+            parameters={"id": created["id"]},
+        )
+    fetched = client.get(f"/api/map-areas/{created['id']}")
+    listed = client.get(f"/api/map-areas?project_id={project['id']}")
+
+    assert rejected.status_code == 400
+    assert rejected.get_json()["error"] == (
+        "default_center_lat must be a number"
+    )
+    assert fetched.status_code == 200
+    assert fetched.get_json()["default_center_lat"] is None
+    assert listed.status_code == 200
+    assert listed.get_json()["map_areas"][0]["id"] == created["id"]
@@ -27,9 +27,14 @@ To Do:
 
 import requests
 
+from database import DatabaseContext, DatabaseManager
+
 BASE_URL = "http://localhost:5000"
 API_PREFIX = "/api"
 
+# One keep-alive connection for every request in this module
+SESSION = requests.Session()
+
 
 class TestGetProjects:
     """
@@ -55,7 +60,7 @@ class TestGetProjects:
         """
 
         url = f"{BASE_URL}{API_PREFIX}/projects"
-        response = requests.get(url)
+        response = SESSION.get(url)
 
         # Validate response code
         assert response.status_code == 200
@@ -107,7 +112,7 @@ class TestGetProjects:
 
         # Get a list of projects to find a valid project ID
         url = f"{BASE_URL}{API_PREFIX}/projects"
-        response = requests.get(url)
+        response = SESSION.get(url)
         assert response.status_code == 200
         data = response.json()
 
@@ -122,7 +127,7 @@ class TestGetProjects:
 
             # Make request
             url = f"{BASE_URL}{API_PREFIX}/projects/{project_id}"
-            response = requests.get(url)
+            response = SESSION.get(url)
 
             # Validate response code and content
             assert response.status_code == 200
@@ -144,7 +149,7 @@ class TestGetProjects:
 
         # Use a very large ID that is unlikely to exist
         url = f"{BASE_URL}{API_PREFIX}/projects/{invalid_project_id}"
-        response = requests.get(url)
+        response = SESSION.get(url)
 
         # Validate response code and content
         assert response.status_code == 404
@@ -174,7 +179,7 @@ class TestCreateProject:
         """
 
         url = f"{BASE_URL}{API_PREFIX}/projects"
-        response = requests.post(
+        response = SESSION.post(
             url,
             json=valid_new_project
         )
@@ -206,7 +211,7 @@ class TestCreateProject:
         """
 
         url = f"{BASE_URL}{API_PREFIX}/projects"
-        response = requests.post(
+        response = SESSION.post(
             url,
             json=invalid_new_project
         )
@@ -241,7 +246,7 @@ class TestExportProject:
         """
 
         url = f"{BASE_URL}{API_PREFIX}/projects/{valid_project_id}/export"
-        response = requests.get(url)
+        response = SESSION.get(url)
 
         # Validate response
         assert response.status_code == 200
@@ -580,3 +585,155 @@ class TestExportProject:
                     f"{annotation.get('updated_at')!r}; "
                     f"full item={annotation!r}"
                 )
+
+
+def test_update_project_returns_stored_values(client, create_project):
+    project = create_project(name="Before Update")
+
+    response = client.put(
+        f"/api/projects/{project['id']}",
+        json={
+            "name": "After Update",
+            "description": "Updated by endpoint test",
+            "center_lat": -34,
+            "center_lon": 151,
+            "zoom_level": 9,
+        },
+    )
+    updated = response.get_json()
+    fetched = client.get(f"/api/projects/{project['id']}").get_json()
+    missing = client.put("/api/projects/999999", json={"name": "Nobody"})
+
+    assert response.status_code == 200
+    assert updated["id"] == project["id"]
+    assert updated["name"] == "After Update"
+    assert updated["description"] == "Updated by endpoint test"
+    assert updated["center_lat"] == -34.0
+    assert isinstance(updated["center_lat"], float)
+    assert updated["center_lon"] == 151.0
+    assert isinstance(updated["center_lon"], float)
+    assert updated["zoom_level"] == 9
+    for field in (
+        "id",
+        "name",
+        "description",
+        "center_lat",
+        "center_lon",
+        "zoom_level",
+        "created_at",
+        "updated_at",
+    ):
+        assert updated[field] == fetched[field], field
+        assert type(updated[field]) is type(fetched[field]), field
+    assert missing.status_code == 404
+
+
+def test_non_numeric_center_cannot_break_reads(app, client, create_project):
+    project = create_project(name="Bad Centre")
+
+    rejected = client.put(
+        f"/api/projects/{project['id']}",
+        json={"center_lat": "abc", "zoom_level": True},
+    )
+    unchanged = client.get(f"/api/projects/{project['id']}").get_json()
+
+    # A bad value stored before updates were checked still reads back
+    with DatabaseContext(app.config["DATABASE_PATH"]) as db_ctx:
+        DatabaseManager(db_ctx).update(
+            table="projects",
+            fields={"center_lon": "abc"},
+            parameters={"id": project["id"]},
+        )
+    fetched = client.get(f"/api/projects/{project['id']}")
+
+    assert rejected.status_code == 400
+    assert rejected.get_json()["error"] == "center_lat must be a number"
+    assert unchanged["center_lat"] == project["center_lat"]
+    assert unchanged["zoom_level"] == project["zoom_level"]
+    assert fetched.status_code == 200
+    assert fetched.get_json()["center_lon"] == "abc"
+
+
+def test_export_import_rebuilds_parent_links(client, create_project):
+    project = create_project(name="Round Trip")
+
+    # The child is created first, so its parent ends up with a higher id
+    child = client.post(
+        "/api/map-areas",
+        json={
+            "project_id": project["id"],
+            "name": "Child Suburb",
+            "area_type": "suburb",
+        },
+    ).get_json()
+    client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": child["id"],
+            "coordinates": [[-33.9, 151.1], [-33.9, 151.3], [-33.7, 151.3]],
+        },
+    )
+    parent = client.post(
+        "/api/map-areas",
+        json={
+            "project_id": project["id"],
+            "name": "Parent Region",
+            "area_type": "region",
+        },
+    ).get_json()
+    client.post(
+        "/api/boundaries",
+        json={
+            "map_area_id": parent["id"],
+            "coordinates": [[-34, 151], [-34, 152], [-33, 152], [-33, 151]],
+        },
+    )
+    client.put(
+        f"/api/map-areas/{child['id']}",
+        json={"parent_id": parent["id"]},
+    )
+    assert parent["id"] > child["id"]
+
+    for area in (parent, child):
+        layer = client.post(
+            "/api/layers",
+            json={
+                "map_area_id": area["id"],
+                "name": f"{area['name']} Notes",
+                "layer_type": "annotation",
+            },
+        ).get_json()
+        for content in ("first", "second"):
+            client.post(
+                "/api/annotations",
+                json={
+                    "layer_id": layer["id"],
+                    "annotation_type": "marker",
+                    "coordinates": [-33.8, 151.2],
+                    "content": f"{area['name']} {content}",
+                },
+            )
+
+    exported = client.get(f"/api/projects/{project['id']}/export").get_json()
+    response = client.post("/api/projects/import", json=exported)
+    imported_id = response.get_json()["project"]["id"]
+    reexported = client.get(f"/api/projects/{imported_id}/export").get_json()
+
+    areas = {area["name"]: area for area in reexported["map_areas"]}
+
+    assert response.status_code == 201
+    assert imported_id != project["id"]
+    assert areas["Parent Region"]["parent_id"] is None
+    assert (
+        areas["Child Suburb"]["parent_id"] == areas["Parent Region"]["id"]
+    )
+    assert len(reexported["map_areas"]) == len(exported["map_areas"]) == 2
+    assert len(reexported["boundaries"]) == len(exported["boundaries"]) == 2
+    assert len(reexported["annotations"]) == len(exported["annotations"])
+    assert len(exported["annotations"]) == 4
+    assert sorted(a["content"] for a in reexported["annotations"]) == sorted(
+        a["content"] for a in exported["annotations"]
+    )
+    assert {
+        boundary["map_area_id"] for boundary in reexported["boundaries"]
+    } == {area["id"] for area in reexported["map_areas"]}